@@ -3,7 +3,6 @@
 Script to rename description column to display and update existing commands
 """
 
-import asyncio
 import sys
 import os
 
@@ -11,13 +10,13 @@ import os
 backend_path = os.path.join(os.path.dirname(__file__), 'backend')
 sys.path.insert(0, backend_path)
 
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.core.database import get_db
-from app.models.settings import DeviceCommand
-
-async def add_descriptions_to_commands():
+def add_descriptions_to_commands():
     """Add descriptions to existing commands and ensure column exists"""
+    # Imported here so the ORM and database engine load only when run
+    from sqlalchemy.orm import Session
+    from sqlalchemy import text
+    from app.core.database import get_db
+    from app.models.settings import DeviceCommand
 
     # Command descriptions mapping
     command_descriptions = {
@@ -76,4 +75,4 @@ async def add_descriptions_to_commands():
         db.close()
 
 if __name__ == "__main__":
-    asyncio.run(add_descriptions_to_commands())
\ No newline at end of file
+    add_descriptions_to_commands()
\ No newline at end of file
@@ -3,7 +3,6 @@
 Script to add test device commands to the database
 """
 
-import asyncio
 import sys
 import os
 
@@ -11,12 +10,12 @@ import os
 backend_path = os.path.join(os.path.dirname(__file__), 'backend')
 sys.path.insert(0, backend_path)
 
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.settings import DeviceCommand, CommandPlatform, CommandParser
-
-async def add_test_commands():
+def add_test_commands():
     """Add test commands for different platforms"""
+    # Imported here so the ORM and database engine load only when run
+    from sqlalchemy.orm import Session
+    from app.core.database import get_db
+    from app.models.settings import DeviceCommand, CommandPlatform, CommandParser
     
     # Test commands for different platforms
     test_commands = [
@@ -93,4 +92,4 @@ async def add_test_commands():
         db.close()
 
 if __name__ == "__main__":
-    asyncio.run(add_test_commands())
\ No newline at end of file
+    add_test_commands()
\ No newline at end of file
@@ -6,7 +6,7 @@ import logging
 import json
 import shutil
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -38,6 +38,7 @@ from ..models.settings import (
 )
 from pydantic import BaseModel
 from ..services.nautobot import nautobot_service
+from ..core.cache import cache_service, SNAPSHOT_COMMANDS_CACHE_KEY
 from ..services.checkmk import checkmk_service
 
 logger = logging.getLogger(__name__)
@@ -73,6 +74,24 @@ def upsert_setting(
     return setting
 
 
+def upsert_settings(db: Session, items: List[Tuple[str, str]]) -> None:
+    """Create or update several settings, loading the existing ones in one query."""
+    existing = {
+        setting.key: setting
+        for setting in db.query(AppSettings).filter(
+            AppSettings.key.in_([key for key, _ in items])
+        )
+    }
+
+    for key, value in items:
+        setting = existing.get(key)
+        if setting:
+            setting.value = value
+        else:
+            existing[key] = AppSettings(key=key, value=value)
+            db.add(existing[key])
+
+
 def build_nautobot_settings(db: Session) -> Dict[str, Any]:
     """Build Nautobot settings dict from database and environment."""
     stored_settings = {s.key: s.value for s in db.query(AppSettings).all()}
@@ -285,6 +304,7 @@ async def create_device_command(
         db.add(command)
         db.commit()
         db.refresh(command)
+        await cache_service.delete(SNAPSHOT_COMMANDS_CACHE_KEY)
         return command
     except HTTPException:
         # Re-raise HTTP exceptions (like duplicate validation)
@@ -378,6 +398,7 @@ async def update_device_command(
 
         db.commit()
         db.refresh(command)
+        await cache_service.delete(SNAPSHOT_COMMANDS_CACHE_KEY)
         return command
     except HTTPException:
         # Re-raise HTTP exceptions (like duplicate validation)
@@ -407,6 +428,7 @@ async def delete_device_command(
     try:
         db.delete(command)
         db.commit()
+        await cache_service.delete(SNAPSHOT_COMMANDS_CACHE_KEY)
         return {"message": f"Device command with ID {command_id} deleted successfully"}
     except Exception as e:
         logger.error(f"Error deleting device command: {str(e)}")
@@ -1076,16 +1098,18 @@ async def save_unified_settings(
                 ]
             )
 
-        # Save all settings using helper function
+        # Save all settings in one batch, written with the commit below
         logger.info(f"💾 Total settings to save: {len(settings_to_save)}")
+        unmasked_settings = []
         for key, value in settings_to_save:
             if value != "***":  # Skip masked passwords
                 logger.info(
                     f"💾 Saving setting: {key} = {value[:50] if len(str(value)) > 50 else value}"
                 )
-                upsert_setting(db, key, value)
+                unmasked_settings.append((key, value))
             else:
                 logger.info(f"💾 Skipping masked value for: {key}")
+        upsert_settings(db, unmasked_settings)
 
         # Save database configuration to YAML
         if hasattr(settings_data, "database") and settings_data.database:
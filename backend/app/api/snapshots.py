@@ -2,6 +2,7 @@
 Snapshots API for managing device baselines and snapshots.
 """
 
+import json
 import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -19,6 +20,27 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 security = HTTPBearer()
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _pretty_json(value: Optional[str]) -> Optional[str]:
+    """Pretty-print stored JSON output for display (it is stored compact)."""
+    if not value:
+        return value
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(orjson.loads(value), option=orjson.OPT_INDENT_2).decode(
+                "utf-8"
+            )
+        return json.dumps(json.loads(value), indent=2)
+    except ValueError:
+        return value
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -238,8 +260,8 @@ async def get_snapshot_detail(
             if snapshot.updated_at
             else None,
             "notes": snapshot.notes,
-            "raw_output": snapshot.raw_output,
-            "normalized_output": snapshot.normalized_output,
+            "raw_output": _pretty_json(snapshot.raw_output),
+            "normalized_output": _pretty_json(snapshot.normalized_output),
         }
 
     except HTTPException:
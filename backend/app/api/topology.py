@@ -307,14 +307,16 @@ async def discover_topology_async(
         Job ID and initial status
     """
     try:
-        from app.tasks.topology_tasks import discover_topology_task
+        from app.services.background_jobs import celery_app
 
         logger.info(
             f"📡 Starting async topology discovery for {len(request.device_ids)} devices"
         )
 
-        # Submit task to Celery
-        task = discover_topology_task.apply_async(
+        # Submit task to Celery by name, so the API does not import the task
+        # modules and the discovery stack they pull in
+        task = celery_app.send_task(
+            "app.tasks.topology_tasks.discover_topology_task",
             kwargs={
                 "device_ids": request.device_ids,
                 "include_static_routes": request.include_static_routes,
@@ -326,7 +328,7 @@ async def discover_topology_async(
                 "include_interfaces": request.include_interfaces,
                 "cache_results": request.cache_results,
                 "auth_token": credentials.credentials,
-            }
+            },
         )
 
         logger.info(f"✅ Task submitted with job_id: {task.id}")
@@ -497,6 +499,30 @@ async def discover_topology(
         )
 
 
+def _get_discovery_summary(meta: dict) -> Optional[dict]:
+    """
+    Get the aggregated result of a Celery discovery job, if it has finished.
+
+    Args:
+        meta: Result of the discover_topology_task orchestrator
+
+    Returns:
+        Result of the aggregate_discovery_results chord callback, or None if
+        the job has no callback or it has not succeeded (yet)
+    """
+    from celery.result import AsyncResult
+    from app.services.background_jobs import celery_app
+
+    result_id = meta.get("result_id") if isinstance(meta, dict) else None
+    if not result_id:
+        return None
+
+    callback = AsyncResult(result_id, app=celery_app)
+    if callback.status != "SUCCESS":
+        return None
+    return callback.result
+
+
 @router.get("/discover/progress/{job_id}", response_model=TopologyDiscoveryProgress)
 async def get_discovery_progress(
     job_id: str, current_user: dict = Depends(get_current_user)
@@ -542,7 +568,24 @@ async def get_discovery_progress(
         meta = result.get("info", {}) or result.get("result", {})
 
         # If orchestrator completed, it returns group_id for tracking child tasks
+        # and result_id for the aggregated result of the whole job
         if celery_status in ["SUCCESS", "PROGRESS", "STARTED"]:
+            summary = _get_discovery_summary(meta)
+            if summary:
+                # All devices finished: one result read instead of one per device
+                return {
+                    "job_id": job_id,
+                    "status": summary["status"],
+                    "total_devices": summary["total_devices"],
+                    "completed_devices": summary["successful_devices"],
+                    "failed_devices": summary["failed_devices"],
+                    "progress_percentage": 100,
+                    "devices": summary["devices"],
+                    "started_at": summary["started_at"],
+                    "completed_at": summary["completed_at"],
+                    "error": None,
+                }
+
             group_id = meta.get("group_id")
             device_ids = meta.get("device_ids", [])
             total_devices = meta.get("total_devices", 0)
@@ -581,6 +624,16 @@ async def get_discovery_progress(
                             device_progress = 0
                             failed += 1
                             device_error = str(child_meta.get("error", "Unknown error"))
+                        elif child_meta.get("status") == "completed":
+                            # Device tasks do not store their return value; the
+                            # last progress update carries the outcome
+                            device_status = "completed"
+                            device_progress = 100
+                            completed += 1
+                        elif child_meta.get("status") == "failed":
+                            device_status = "failed"
+                            failed += 1
+                            device_error = child_meta.get("error") or "Unknown error"
                         elif child_status in ["PROGRESS", "STARTED"]:
                             device_status = "in_progress"
                             device_progress = child_meta.get("progress_percentage", 0)
@@ -591,6 +644,7 @@ async def get_discovery_progress(
                         devices_progress.append(
                             {
                                 "device_id": device_id,
+                                "device_name": device_id,
                                 "status": device_status,
                                 "progress_percentage": device_progress,
                                 "current_step": current_step,
@@ -659,6 +713,7 @@ async def get_discovery_progress(
             }
         else:
             # Task still pending/starting
+            device_status = meta.get("device_status", {})
             return {
                 "job_id": job_id,
                 "status": our_status,
@@ -666,7 +721,15 @@ async def get_discovery_progress(
                 "completed_devices": 0,
                 "failed_devices": 0,
                 "progress_percentage": 0,
-                "devices": [],
+                "devices": [
+                    {
+                        "device_id": device_id,
+                        "device_name": device_id,
+                        "status": status,
+                        "progress_percentage": 0,
+                    }
+                    for device_id, status in device_status.items()
+                ],
                 "started_at": meta.get("started_at"),
                 "completed_at": None,
                 "error": None,
@@ -773,6 +836,19 @@ async def get_discovery_result(
         job = AsyncTopologyDiscoveryService.get_job_progress(job_id)
 
         if not job:
+            # Jobs started via /discover-async run in Celery; their final
+            # result is aggregated by the chord callback
+            from app.services.background_jobs import background_job_service
+
+            orchestrator = background_job_service.get_job_status(job_id)
+            summary = _get_discovery_summary(orchestrator.get("result") or {})
+            if summary:
+                return summary
+            if orchestrator.get("status") in ["STARTED", "PROGRESS", "SUCCESS"]:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Discovery job {job_id} is still running. Use /discover/progress/{job_id} to check progress.",
+                )
             raise HTTPException(
                 status_code=404, detail=f"Discovery job {job_id} not found"
             )
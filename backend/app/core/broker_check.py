@@ -0,0 +1,57 @@
+"""
+Start-up check of the Celery broker, shared by start_worker.py and start_beat.py.
+"""
+
+import logging
+import socket
+from urllib.parse import urlparse
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Broker URL schemes with a host and port that a plain TCP connect can probe
+TCP_SCHEMES = ("redis", "rediss")
+# Schemes the Redis client connects to itself (unix:// is a local socket path)
+CLIENT_SCHEMES = TCP_SCHEMES + ("unix",)
+
+
+def check_redis_connection(strict=False):
+    """
+    Check if Redis is accessible.
+
+    By default only a TCP connection to the broker is opened; with strict=True,
+    or for a unix:// socket URL, the Redis client connects, authenticates and
+    pings. Other schemes (e.g. sentinel://) are not probed, since their URL does
+    not name the Redis server the broker ends up using.
+
+    Args:
+        strict: Log in and PING instead of only opening a TCP connection
+
+    Returns:
+        True if the broker is reachable or was not probed, False otherwise
+    """
+    broker_url = settings.celery_broker_url
+    url = urlparse(broker_url)
+    if url.scheme not in CLIENT_SCHEMES:
+        logger.info(f"Skipping Redis check for {url.scheme}:// broker URL")
+        return True
+
+    try:
+        if strict or url.scheme not in TCP_SCHEMES:
+            import redis
+
+            # Close the probe connection right away; the caller opens its own
+            with redis.from_url(broker_url, socket_connect_timeout=2) as r:
+                r.ping()
+        else:
+            with socket.create_connection(
+                (url.hostname or "localhost", url.port or 6379), timeout=2
+            ):
+                pass
+        logger.info(f"✓ Redis is accessible at {broker_url}")
+        return True
+    except Exception as e:
+        logger.error(f"✗ Cannot connect to Redis: {e}")
+        logger.error("  Make sure Redis is running: redis-server")
+        return False
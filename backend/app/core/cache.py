@@ -4,7 +4,9 @@ Cache service for NOC Canvas using Redis.
 
 import json
 import logging
-from typing import Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Set
 from .config import settings
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,29 @@ except ImportError:
     logger.warning("Redis library not available. Caching will be disabled.")
     REDIS_AVAILABLE = False
 
+# Redis hash counting cache lookups per "service:endpoint" since the last warm-up
+ACCESS_STATS_KEY = "cache:access_stats"
+# Lookups are counted in-process and added to ACCESS_STATS_KEY with the next
+# cache write, or after this many lookups, so a cache hit is normally one GET
+ACCESS_STATS_FLUSH_EVERY = 100
+
+# Snapshot commands grouped by platform, cached by the baseline tasks between
+# runs. Invalidated by the device command settings endpoints on every write.
+SNAPSHOT_COMMANDS_CACHE_KEY = "baseline:snapshot_commands_by_platform"
+
+
+class CacheRefresh:
+    """State of a cache refresh, see CacheService.refreshing()."""
+
+    def __init__(self, ttl: int, min_remaining: int):
+        self.ttl = ttl
+        self.min_remaining = min_remaining
+        self.refetched: Set[str] = set()
+
+
+# Set while refreshing: stale reads miss so callers refetch, writes use its TTL
+_refresh: ContextVar[Optional[CacheRefresh]] = ContextVar("cache_refresh", default=None)
+
 
 class CacheService:
     """Redis-based cache service."""
@@ -24,6 +49,8 @@ class CacheService:
     def __init__(self):
         self.redis: Optional[Any] = None
         self.enabled = REDIS_AVAILABLE
+        self._access_counts: Dict[str, int] = {}
+        self._pending_lookups = 0
 
     async def connect(self):
         """Connect to Redis."""
@@ -64,8 +91,21 @@ class CacheService:
         if not self.redis:
             return None
 
+        refresh = _refresh.get()
+        if refresh is not None:
+            return await self._get_unless_stale(key, refresh)
+
         try:
-            value = await self.redis.get(key)
+            endpoint = ":".join(key.split(":", 2)[:2])
+            self._access_counts[endpoint] = self._access_counts.get(endpoint, 0) + 1
+            self._pending_lookups += 1
+            if self._pending_lookups >= ACCESS_STATS_FLUSH_EVERY:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.get(key)
+                self._queue_access_stats(pipe)
+                value = (await pipe.execute())[0]
+            else:
+                value = await self.redis.get(key)
             if value:
                 return json.loads(value)
             return None
@@ -73,15 +113,37 @@ class CacheService:
             logger.error(f"Cache get error for key {key}: {e}")
             return None
 
+    async def _get_unless_stale(self, key: str, refresh: CacheRefresh) -> Optional[Any]:
+        """Get a value while refreshing, missing if it expires too soon."""
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.ttl(key)
+            value, remaining = await pipe.execute()
+            if value and remaining >= refresh.min_remaining:
+                return json.loads(value)
+        except Exception as e:
+            logger.error(f"Cache get error for key {key}: {e}")
+
+        refresh.refetched.add(key)
+        return None
+
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache with optional TTL."""
         if not self.redis:
             return False
 
         try:
-            ttl = ttl or settings.cache_ttl_seconds
+            refresh = _refresh.get()
+            ttl = (refresh and refresh.ttl) or ttl or settings.cache_ttl_seconds
             serialized_value = json.dumps(value, default=str)
-            await self.redis.setex(key, ttl, serialized_value)
+            if self._access_counts:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.setex(key, ttl, serialized_value)
+                self._queue_access_stats(pipe)
+                await pipe.execute()
+            else:
+                await self.redis.setex(key, ttl, serialized_value)
             return True
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
@@ -113,6 +175,77 @@ class CacheService:
             logger.error(f"Cache clear pattern error for {pattern}: {e}")
             return 0
 
+    @contextmanager
+    def refreshing(self, ttl: int, min_remaining: int):
+        """Refetch and rewrite soon-to-expire cached values within this context.
+
+        Lookups made inside the context miss for entries that expire within
+        min_remaining seconds, so the service methods fetch fresh data and
+        overwrite them (with the given TTL) without deleting them first.
+        Readers outside the context keep getting the old values until the new
+        ones are written.
+
+        Args:
+            ttl: TTL in seconds for the values written while refreshing
+            min_remaining: Entries with at least this many seconds left are
+                considered fresh and returned as usual
+
+        Yields:
+            CacheRefresh whose refetched attribute collects the missed keys
+        """
+        refresh = CacheRefresh(ttl, min_remaining)
+        token = _refresh.set(refresh)
+        try:
+            yield refresh
+        finally:
+            _refresh.reset(token)
+
+    async def acquire_lock(self, key: str, ttl: int) -> bool:
+        """Acquire a simple expiring lock.
+
+        Args:
+            key: Lock key
+            ttl: Seconds after which the lock expires on its own
+
+        Returns:
+            True if the lock was acquired, or caching is unavailable
+        """
+        if not self.redis:
+            return True
+
+        try:
+            return bool(await self.redis.set(key, "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Cache lock error for key {key}: {e}")
+            return True
+
+    def _queue_access_stats(self, pipe) -> None:
+        """Add the lookups counted so far to pipe and reset the counts."""
+        for endpoint, count in self._access_counts.items():
+            pipe.hincrby(ACCESS_STATS_KEY, endpoint, count)
+        self._access_counts = {}
+        self._pending_lookups = 0
+
+    async def pop_access_stats(self) -> Dict[str, int]:
+        """Return lookup counts per "service:endpoint" and reset them.
+
+        Returns:
+            Dictionary mapping "service:endpoint" to the number of lookups
+            since the previous call
+        """
+        if not self.redis:
+            return {}
+
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.hgetall(ACCESS_STATS_KEY)
+            pipe.delete(ACCESS_STATS_KEY)
+            stats, _ = await pipe.execute()
+            return {endpoint: int(count) for endpoint, count in stats.items()}
+        except Exception as e:
+            logger.error(f"Cache access stats error: {e}")
+            return {}
+
     def generate_key(self, service: str, endpoint: str, **kwargs) -> str:
         """Generate a cache key."""
         key_parts = [service, endpoint]
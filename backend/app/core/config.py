@@ -58,6 +58,16 @@ class Settings(BaseSettings):
     # Cache TTL settings
     cache_ttl_seconds: int = 600  # 10 minutes default
 
+    # Cache warm-up: refresh only the most looked-up endpoints
+    cache_warm_up_top_n: int = 6
+    cache_warm_up_min_accesses: int = 2
+    # Warm-up runs on this interval and writes entries with a longer TTL, so
+    # they are refreshed before they expire
+    cache_warm_up_interval_seconds: int = 600
+    cache_warm_up_ttl_seconds: int = 1800
+    # Queue a warm-up when the API starts instead of waiting for the first beat
+    cache_warm_up_on_startup: bool = True
+
     # Device communication settings
     device_default_username: Optional[str] = None
     device_default_password: Optional[str] = None
@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from .yaml_config import get_database_url
 import logging
 
@@ -13,7 +13,15 @@ def create_database_engine():
     try:
         database_url = get_database_url()
         logger.info("Creating database engine for PostgreSQL")
-        return create_engine(database_url, pool_pre_ping=True, pool_recycle=300)
+        return create_engine(
+            database_url,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            # Batch executemany() INSERT/UPDATE statements (e.g. snapshot rows
+            # flushed per device) into multi-row statements
+            executemany_mode="values_plus_batch",
+            executemany_values_page_size=1000,
+        )
     except Exception as e:
         logger.error(f"Failed to create database engine: {e}")
         raise
@@ -22,6 +30,10 @@ def create_database_engine():
 engine = create_database_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Process/thread-local session for Celery workers; released with
+# ScopedSession.remove() at the end of each task and on worker shutdown
+ScopedSession = scoped_session(SessionLocal)
+
 Base = declarative_base()
 
 
@@ -3,25 +3,27 @@ Dynamic Settings Loader
 Loads settings from database with fallback to environment variables
 """
 
-from typing import Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 from .config import settings as env_settings
 from ..models.settings import AppSettings
 
 
-def get_dynamic_setting(
-    db: Session, key: str, default: Optional[str] = None
+def _load_stored_settings(db: Session, keys: List[str]) -> Dict[str, str]:
+    """Load the stored values of several settings with one query."""
+    return {
+        setting.key: setting.value
+        for setting in db.query(AppSettings).filter(AppSettings.key.in_(keys))
+    }
+
+
+def _resolve_setting(
+    stored: Dict[str, str], key: str, default: Optional[str] = None
 ) -> Optional[str]:
-    """
-    Get a setting value with priority:
-    1. Database (latest saved value)
-    2. Environment variable
-    3. Default value
-    """
+    """Pick a setting value from the stored values, the environment or the default."""
     # Try database first
-    setting = db.query(AppSettings).filter(AppSettings.key == key).first()
-    if setting and setting.value:
-        return setting.value
+    if stored.get(key):
+        return stored[key]
 
     # Fallback to environment variable
     env_value = getattr(env_settings, key, None)
@@ -32,18 +34,36 @@ def get_dynamic_setting(
     return default
 
 
+def get_dynamic_setting(
+    db: Session, key: str, default: Optional[str] = None
+) -> Optional[str]:
+    """
+    Get a setting value with priority:
+    1. Database (latest saved value)
+    2. Environment variable
+    3. Default value
+    """
+    return _resolve_setting(_load_stored_settings(db, [key]), key, default)
+
+
 def get_nautobot_config(db: Session) -> dict:
     """Get Nautobot configuration from database with env fallback"""
+    stored = _load_stored_settings(
+        db,
+        ["nautobot_url", "nautobot_token", "nautobot_timeout", "nautobot_verify_tls"],
+    )
     return {
-        "url": get_dynamic_setting(db, "nautobot_url", env_settings.nautobot_url),
-        "token": get_dynamic_setting(db, "nautobot_token", env_settings.nautobot_token),
+        "url": _resolve_setting(stored, "nautobot_url", env_settings.nautobot_url),
+        "token": _resolve_setting(
+            stored, "nautobot_token", env_settings.nautobot_token
+        ),
         "timeout": int(
-            get_dynamic_setting(
-                db, "nautobot_timeout", str(env_settings.nautobot_timeout)
+            _resolve_setting(
+                stored, "nautobot_timeout", str(env_settings.nautobot_timeout)
             )
         ),
-        "verify_ssl": get_dynamic_setting(
-            db, "nautobot_verify_tls", str(env_settings.nautobot_verify_ssl)
+        "verify_ssl": _resolve_setting(
+            stored, "nautobot_verify_tls", str(env_settings.nautobot_verify_ssl)
         ).lower()
         == "true",
     }
@@ -51,22 +71,33 @@ def get_nautobot_config(db: Session) -> dict:
 
 def get_checkmk_config(db: Session) -> dict:
     """Get CheckMK configuration from database with env fallback"""
+    stored = _load_stored_settings(
+        db,
+        [
+            "checkmk_url",
+            "checkmk_site",
+            "checkmk_username",
+            "checkmk_password",
+            "checkmk_verify_ssl",
+            "checkmk_timeout",
+        ],
+    )
     return {
-        "url": get_dynamic_setting(db, "checkmk_url", env_settings.checkmk_url),
-        "site": get_dynamic_setting(db, "checkmk_site", env_settings.checkmk_site),
-        "username": get_dynamic_setting(
-            db, "checkmk_username", env_settings.checkmk_username
+        "url": _resolve_setting(stored, "checkmk_url", env_settings.checkmk_url),
+        "site": _resolve_setting(stored, "checkmk_site", env_settings.checkmk_site),
+        "username": _resolve_setting(
+            stored, "checkmk_username", env_settings.checkmk_username
         ),
-        "password": get_dynamic_setting(
-            db, "checkmk_password", env_settings.checkmk_password
+        "password": _resolve_setting(
+            stored, "checkmk_password", env_settings.checkmk_password
         ),
-        "verify_ssl": get_dynamic_setting(
-            db, "checkmk_verify_ssl", str(env_settings.checkmk_verify_ssl)
+        "verify_ssl": _resolve_setting(
+            stored, "checkmk_verify_ssl", str(env_settings.checkmk_verify_ssl)
         ).lower()
         == "true",
         "timeout": int(
-            get_dynamic_setting(
-                db, "checkmk_timeout", str(env_settings.checkmk_timeout)
+            _resolve_setting(
+                stored, "checkmk_timeout", str(env_settings.checkmk_timeout)
             )
         ),
     }
@@ -29,6 +29,7 @@ from .api import (
 #     nautobot_jobs,
 #     nautobot_network,
 # )
+import asyncio
 import logging
 import sys
 
@@ -42,6 +43,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _submit_cache_warm_up():
+    """Queue the cache warm-up task; runs in a thread as it may block on the broker."""
+    try:
+        from .services.background_jobs import background_job_service
+
+        background_job_service.submit_job("app.tasks.cache_tasks.cache_warm_up")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not queue cache warm-up on startup: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -121,12 +132,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Could not clean expired cache on startup: {e}")
 
+    # Nautobot requests made by the API reuse keep-alive connections
+    from .services.nautobot import nautobot_service
+
+    nautobot_service.pool_clients(asyncio.get_running_loop())
+
+    # Warm the service caches in the background without delaying startup
+    if settings.cache_warm_up_on_startup:
+        asyncio.get_running_loop().run_in_executor(None, _submit_cache_warm_up)
+
     logger.info("✅ Application startup completed")
 
     yield
 
     # Shutdown
     logger.info("Shutting down NOC Canvas application...")
+    await nautobot_service.close()
     await cache_service.disconnect()
     logger.info("✅ Application shutdown completed")
 
@@ -0,0 +1,60 @@
+"""
+Database migration: Add content_hash column to snapshots table
+
+The content_hash column stores a hash of normalized_output so that baseline
+runs can skip rewriting (and re-versioning) baselines whose normalized output
+has not changed. Existing rows are left with NULL and get a hash the next time
+their baseline is updated.
+
+Run this script once to add the column:
+    python -m app.migrations.add_snapshot_content_hash
+"""
+
+import logging
+from sqlalchemy import inspect, text
+from app.core.database import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_migration():
+    """Add the content_hash column to the snapshots table if it doesn't exist."""
+    try:
+        inspector = inspect(engine)
+
+        if "snapshots" not in inspector.get_table_names():
+            logger.info(
+                "Table 'snapshots' does not exist yet. It will be created with "
+                "the content_hash column on startup. Skipping migration."
+            )
+            return
+
+        columns = {col["name"] for col in inspector.get_columns("snapshots")}
+        if "content_hash" in columns:
+            logger.info(
+                "Column 'snapshots.content_hash' already exists. Skipping migration."
+            )
+            return
+
+        logger.info("Adding 'content_hash' column to 'snapshots' table...")
+
+        with engine.begin() as conn:
+            conn.execute(
+                text("ALTER TABLE snapshots ADD COLUMN content_hash VARCHAR(64)")
+            )
+
+        logger.info("✅ Successfully added 'snapshots.content_hash' column")
+        logger.info("Migration completed successfully!")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Running migration: Add content_hash column to snapshots")
+    print("=" * 60)
+    run_migration()
+    print("=" * 60)
@@ -0,0 +1,64 @@
+"""
+Database migration: Replace snapshot (device_id, type) index with (device_id, type, command)
+
+Baseline runs look up all existing baselines of a device for a set of commands
+in one query filtered by device_id, type and command. The composite index
+ix_snapshot_device_type_command serves that lookup directly and, as its prefix
+is (device_id, type), also every query the old ix_snapshot_device_type index
+was used for, so the old index is dropped.
+
+Run this script once to apply:
+    python -m app.migrations.add_snapshot_lookup_index
+"""
+
+import logging
+from sqlalchemy import inspect, text
+from app.core.database import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+NEW_INDEX = "ix_snapshot_device_type_command"
+OLD_INDEX = "ix_snapshot_device_type"
+
+
+def run_migration():
+    """Create the (device_id, type, command) index and drop the old one."""
+    try:
+        inspector = inspect(engine)
+
+        if "snapshots" not in inspector.get_table_names():
+            logger.info("Table 'snapshots' does not exist yet. Skipping migration.")
+            return
+
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes("snapshots")}
+
+        with engine.begin() as conn:
+            if NEW_INDEX in existing_indexes:
+                logger.info(f"Index '{NEW_INDEX}' already exists.")
+            else:
+                logger.info(f"Creating index '{NEW_INDEX}'...")
+                conn.execute(
+                    text(
+                        f"CREATE INDEX {NEW_INDEX} ON snapshots (device_id, type, command)"
+                    )
+                )
+
+            if OLD_INDEX in existing_indexes:
+                logger.info(f"Dropping superseded index '{OLD_INDEX}'...")
+                conn.execute(text(f"DROP INDEX {OLD_INDEX}"))
+
+        logger.info("✅ Snapshot lookup index is up to date")
+        logger.info("Migration completed successfully!")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Running migration: Add snapshot (device_id, type, command) index")
+    print("=" * 60)
+    run_migration()
+    print("=" * 60)
@@ -0,0 +1,89 @@
+"""
+Database migration: Use LZ4 compression for snapshot output columns
+
+Snapshot raw_output/normalized_output values for large tables (e.g.
+"show mac address-table") can be hundreds of KB. PostgreSQL already compresses
+large values out-of-line (TOAST); from PostgreSQL 14 on, the compression method
+can be switched from the default pglz to lz4, which compresses and decompresses
+considerably faster. Decompression stays transparent to readers, so no
+application code changes are needed.
+
+Only newly written values use the new method; existing rows are recompressed
+when they are next updated.
+
+The migration is skipped on servers older than PostgreSQL 14 and on servers
+built without lz4 support.
+
+Run this script once to apply:
+    python -m app.migrations.set_snapshot_output_compression
+"""
+
+import logging
+from sqlalchemy import inspect, text
+from app.core.database import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COMPRESSED_COLUMNS = ("raw_output", "normalized_output")
+
+# PostgreSQL 14 introduced per-column compression methods
+MIN_SERVER_VERSION_NUM = 140000
+
+# lz4 is only offered when the server was built with --with-lz4
+LZ4_SUPPORTED_QUERY = """
+    SELECT 'lz4' = ANY(enumvals)
+    FROM pg_settings
+    WHERE name = 'default_toast_compression'
+"""
+
+
+def run_migration():
+    """Switch snapshot output columns to lz4 compression if supported."""
+    try:
+        inspector = inspect(engine)
+
+        if "snapshots" not in inspector.get_table_names():
+            logger.info("Table 'snapshots' does not exist yet. Skipping migration.")
+            return
+
+        with engine.begin() as conn:
+            server_version_num = int(
+                conn.execute(text("SHOW server_version_num")).scalar()
+            )
+            if server_version_num < MIN_SERVER_VERSION_NUM:
+                logger.info(
+                    f"PostgreSQL server version {server_version_num} does not support "
+                    "column compression methods (requires 14+). Skipping migration."
+                )
+                return
+
+            if not conn.execute(text(LZ4_SUPPORTED_QUERY)).scalar():
+                logger.info(
+                    "PostgreSQL server was built without lz4 support. "
+                    "Skipping migration."
+                )
+                return
+
+            for column in COMPRESSED_COLUMNS:
+                logger.info(f"Setting lz4 compression on 'snapshots.{column}'...")
+                conn.execute(
+                    text(
+                        f"ALTER TABLE snapshots ALTER COLUMN {column} SET COMPRESSION lz4"
+                    )
+                )
+
+        logger.info("✅ Successfully set lz4 compression on snapshot output columns")
+        logger.info("Migration completed successfully!")
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Running migration: Use lz4 compression for snapshot outputs")
+    print("=" * 60)
+    run_migration()
+    print("=" * 60)
@@ -376,6 +376,9 @@ class Snapshot(Base):
     normalized_output = Column(
         String
     )  # Normalized JSON for comparison (optional, can be generated on-demand)
+    content_hash = Column(
+        String(64)
+    )  # Hash of normalized_output, used to skip rewriting unchanged baselines
     created_at = Column(
         DateTime(timezone=True), server_default=func.now()
     )  # When snapshot was first created
@@ -395,7 +398,7 @@ class Snapshot(Base):
         Index("ix_snapshot_device_command", "device_id", "command"),
         Index("ix_snapshot_device_updated", "device_id", "updated_at"),
         Index("ix_snapshot_device_name", "device_name"),
-        Index("ix_snapshot_device_type", "device_id", "type"),
+        Index("ix_snapshot_device_type_command", "device_id", "type", "command"),
     )
 
 
@@ -33,8 +33,21 @@ except ImportError:
     CELERY_AVAILABLE = False
     celery_app = None
 
+try:
+    import msgpack  # noqa: F401
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# msgpack encodes task messages and progress/result state faster and smaller
+# than JSON; JSON stays accepted for messages and results written without it
+SERIALIZER = "msgpack" if MSGPACK_AVAILABLE else "json"
+
 # Configure Celery
 if CELERY_AVAILABLE and celery_app:
+    from kombu import Exchange, Queue
+
     from ..core.database import engine
 
     # Get database URI with password for Celery Beat
@@ -46,22 +59,108 @@ if CELERY_AVAILABLE and celery_app:
         db_uri = str(engine.url).replace("***", engine.url.password or "")
 
     celery_app.conf.update(
-        task_serializer="json",
-        accept_content=["json"],
-        result_serializer="json",
+        task_serializer=SERIALIZER,
+        accept_content=["msgpack", "json"],
+        result_serializer=SERIALIZER,
+        result_accept_content=["msgpack", "json"],
         timezone="UTC",
         enable_utc=True,
         task_track_started=True,
         task_time_limit=30 * 60,  # 30 minutes
         task_soft_time_limit=25 * 60,  # 25 minutes
+        # Reserve only one task at a time so long device tasks spread evenly.
+        # Late acks are enabled per task, on the idempotent device tasks only
         worker_prefetch_multiplier=1,
-        worker_max_tasks_per_child=1000,
+        # Recycle worker processes regularly to release memory held by
+        # long-running discovery and snapshot tasks
+        worker_max_tasks_per_child=100,
+        # Device snapshots run on their own queue so long baseline runs do not
+        # hold up the other background jobs; start_worker.py consumes it.
+        # Topology discovery is I/O-bound and has its own queue so it can be
+        # served by a gevent worker (start_worker.py --pool=gevent)
+        task_routes={
+            "app.tasks.baseline_tasks.*": {"queue": "baseline"},
+            "app.tasks.topology_tasks.*": {"queue": "topology"},
+        },
+        # Declared so a worker started without -Q consumes every queue
+        task_queues=[
+            Queue(name, Exchange(name), routing_key=name)
+            for name in ("celery", "baseline", "topology")
+        ],
         result_extended=True,  # Store task name and other metadata in results
         # Configure Celery Beat with SQLAlchemy scheduler
         beat_scheduler="sqlalchemy_celery_beat.schedulers:DatabaseScheduler",
         beat_dburi=db_uri,  # Use the same database as the app with password
+        # Refresh the service caches before their entries expire
+        beat_schedule={
+            "cache_warm_up": {
+                "task": "app.tasks.cache_tasks.cache_warm_up",
+                "schedule": settings.cache_warm_up_interval_seconds,
+            },
+        },
     )
 
+    from celery.signals import worker_init, worker_process_init, worker_process_shutdown
+
+    def _gevent_patched() -> bool:
+        """Whether the process was monkey-patched for the gevent pool."""
+        try:
+            from gevent import monkey
+
+            return monkey.is_module_patched("socket")
+        except ImportError:
+            return False
+
+    @worker_init.connect
+    def install_uvloop_policy(**kwargs):
+        """Use uvloop for the asyncio loops created by worker tasks, if installed."""
+        if _gevent_patched():
+            # uvloop does not yield to the gevent hub; make psycopg2 yield instead
+            try:
+                from psycogreen.gevent import patch_psycopg
+
+                patch_psycopg()
+                logger.info("gevent pool in use, patched psycopg2 for gevent")
+            except ImportError:
+                logger.warning(
+                    "gevent pool in use but psycogreen is not installed; "
+                    "database calls will block other greenlets"
+                )
+            return
+
+        try:
+            import asyncio
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Installed uvloop event loop policy for Celery worker")
+        except ImportError:
+            logger.info("uvloop not available, using default asyncio event loop")
+
+    @worker_process_init.connect
+    def reset_db_pool(**kwargs):
+        """
+        Drop database connections inherited from the parent worker process and
+        open this process's first one, so its first task does not wait for it.
+        """
+        from ..core.database import engine
+
+        engine.dispose()
+        try:
+            engine.connect().close()
+        except Exception as e:
+            # Tasks connect on demand; a database that is down right now must
+            # not stop the worker process from starting
+            logger.warning(f"Could not open database connection in worker: {e}")
+
+    @worker_process_shutdown.connect
+    def remove_db_session(**kwargs):
+        """Release the worker process's scoped session and its connections."""
+        from ..core.database import ScopedSession, engine
+
+        ScopedSession.remove()
+        engine.dispose()
+
 
 class BackgroundJobService:
     """Service for managing background jobs."""
@@ -131,21 +230,27 @@ class BackgroundJobService:
 
 # Register all tasks
 if CELERY_AVAILABLE and celery_app:
-    # Import and register tasks from task modules
-    from ..tasks import nautobot_tasks
-    from ..tasks import checkmk_tasks
-    from ..tasks import cache_tasks
-    from ..tasks import cleanup_tasks
-    from ..tasks import test_tasks
-    from ..tasks import baseline_tasks
-
-    # Register tasks with the Celery app
-    nautobot_tasks.register_tasks(celery_app)
-    checkmk_tasks.register_tasks(celery_app)
-    cache_tasks.register_tasks(celery_app)
-    cleanup_tasks.register_tasks(celery_app)
-    test_tasks.register_tasks(celery_app)
-    baseline_tasks.register_tasks(celery_app)
+    # Registered once the app is finalized (worker start-up, or the first
+    # access to celery_app.tasks) rather than on import, so processes that
+    # only submit jobs by name do not import every task module and its
+    # dependencies
+    @celery_app.on_after_finalize.connect
+    def register_task_modules(sender, **kwargs):
+        """Import the task modules and register their tasks with the app."""
+        from ..tasks import nautobot_tasks
+        from ..tasks import checkmk_tasks
+        from ..tasks import cache_tasks
+        from ..tasks import cleanup_tasks
+        from ..tasks import test_tasks
+        from ..tasks import baseline_tasks
+
+        # Register tasks with the Celery app
+        nautobot_tasks.register_tasks(sender)
+        checkmk_tasks.register_tasks(sender)
+        cache_tasks.register_tasks(sender)
+        cleanup_tasks.register_tasks(sender)
+        test_tasks.register_tasks(sender)
+        baseline_tasks.register_tasks(sender)
 
 
 # Global service instance
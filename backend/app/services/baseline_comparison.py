@@ -7,6 +7,7 @@ configuration drift and changes between snapshots.
 
 import json
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -16,10 +17,27 @@ from ..models.device_cache import Snapshot, SnapshotType
 
 logger = logging.getLogger(__name__)
 
+# Differences between two stored snapshots, keyed by both rows' id and
+# updated_at so a rewritten row is compared afresh. Bounded, least recently
+# used entries are evicted first.
+_DIFFERENCES_CACHE_SIZE = 1024
+_differences_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
 
 class BaselineComparator:
     """Utility class for comparing snapshots and baselines."""
 
+    # Common identifier fields used to match items between two data sets
+    IDENTIFIER_FIELDS = [
+        "interface",
+        "name",
+        "network",
+        "destination",
+        "address",
+        "neighbor",
+        "mac_address",
+    ]
+
     @staticmethod
     def get_latest_baseline(
         db: Session, device_id: str, command: str, snapshot_type: str = "baseline"
@@ -148,6 +166,10 @@ class BaselineComparator:
         """
         Compare two baseline versions and return differences.
 
+        The differences are memoized per pair of snapshot rows (id and
+        updated_at) in the process; treat the returned "summary" and
+        "differences" as read-only.
+
         Args:
             baseline_old: Older baseline version
             baseline_new: Newer baseline version
@@ -163,14 +185,25 @@ class BaselineComparator:
                 "differences": {...}
             }
         """
-        # Select which output to compare
-        output_field = "normalized_output" if use_normalized else "raw_output"
-
-        old_data = json.loads(getattr(baseline_old, output_field))
-        new_data = json.loads(getattr(baseline_new, output_field))
-
-        # Calculate differences
-        differences = BaselineComparator._calculate_differences(old_data, new_data)
+        # Stored snapshots only change together with updated_at, so the same
+        # pair of rows always yields the same differences
+        cache_key = (
+            baseline_old.id,
+            baseline_old.updated_at,
+            baseline_new.id,
+            baseline_new.updated_at,
+            use_normalized,
+        )
+        differences = _differences_cache.get(cache_key)
+        if differences is not None:
+            _differences_cache.move_to_end(cache_key)
+        else:
+            differences = BaselineComparator._snapshot_differences(
+                baseline_old, baseline_new, use_normalized
+            )
+            _differences_cache[cache_key] = differences
+            if len(_differences_cache) > _DIFFERENCES_CACHE_SIZE:
+                _differences_cache.popitem(last=False)
 
         return {
             "baseline_old": {
@@ -195,6 +228,39 @@ class BaselineComparator:
             "differences": differences["details"],
         }
 
+    @staticmethod
+    def _snapshot_differences(
+        baseline_old: Snapshot, baseline_new: Snapshot, use_normalized: bool
+    ) -> Dict[str, Any]:
+        """
+        Calculate the differences between the outputs of two snapshots.
+
+        Args:
+            baseline_old: Older baseline version
+            baseline_new: Newer baseline version
+            use_normalized: Use normalized output or raw output
+
+        Returns:
+            Dictionary with difference details, as _calculate_differences
+        """
+        # Select which output to compare
+        output_field = "normalized_output" if use_normalized else "raw_output"
+
+        if (
+            use_normalized
+            and baseline_old.content_hash
+            and baseline_old.content_hash == baseline_new.content_hash
+        ):
+            # Identical normalized output: skip parsing and diffing both sides
+            return BaselineComparator._unchanged_differences(
+                json.loads(baseline_new.normalized_output)
+            )
+
+        old_data = json.loads(getattr(baseline_old, output_field))
+        new_data = json.loads(getattr(baseline_new, output_field))
+
+        return BaselineComparator._calculate_differences(old_data, new_data)
+
     @staticmethod
     def compare_current_to_baseline(
         db: Session,
@@ -233,23 +299,28 @@ class BaselineComparator:
                 "command": command,
             }
 
-        # Parse baseline data
-        output_field = "normalized_output" if use_normalized else "raw_output"
-        baseline_data = json.loads(getattr(baseline, output_field))
-
         # Normalize current output if requested
         if use_normalized:
-            from ..tasks.baseline_tasks import _normalize_output
+            from ..tasks.baseline_tasks import _content_hash, _dumps, _normalize_output
 
-            current_output_json = _normalize_output(current_output, command)
-            current_data = json.loads(current_output_json)
+            current_data = _normalize_output(current_output, command)
+            current_hash = _content_hash(_dumps(current_data, sort_keys=True))
         else:
             current_data = current_output
+            current_hash = None
 
-        # Calculate differences
-        differences = BaselineComparator._calculate_differences(
-            baseline_data, current_data
-        )
+        if current_hash and current_hash == baseline.content_hash:
+            # Same normalized output as the baseline: no need to parse it
+            differences = BaselineComparator._unchanged_differences(current_data)
+        else:
+            # Parse baseline data
+            output_field = "normalized_output" if use_normalized else "raw_output"
+            baseline_data = json.loads(getattr(baseline, output_field))
+
+            # Calculate differences
+            differences = BaselineComparator._calculate_differences(
+                baseline_data, current_data
+            )
 
         return {
             "baseline": {
@@ -268,6 +339,51 @@ class BaselineComparator:
             "differences": differences["details"],
         }
 
+    @staticmethod
+    def _unchanged_differences(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the difference result for two data sets known to be identical.
+
+        Args:
+            data: The (shared) dataset
+
+        Returns:
+            Dictionary with difference details, as _calculate_differences
+        """
+        identifier_field = next(
+            (
+                field
+                for field in BaselineComparator.IDENTIFIER_FIELDS
+                if data and field in data[0]
+            ),
+            None,
+        )
+        if identifier_field:
+            item_count = len(
+                {item[identifier_field] for item in data if identifier_field in item}
+            )
+        else:
+            item_count = len(data)
+            identifier_field = "index"
+
+        return {
+            "has_changes": False,
+            "summary": {
+                "items_added": 0,
+                "items_removed": 0,
+                "items_changed": 0,
+                "items_unchanged": item_count,
+                "total_old": item_count,
+                "total_new": item_count,
+            },
+            "details": {
+                "added": [],
+                "removed": [],
+                "changed": [],
+                "identifier_field": identifier_field,
+            },
+        }
+
     @staticmethod
     def _calculate_differences(
         old_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]]
@@ -284,15 +400,7 @@ class BaselineComparator:
         """
         # Convert lists to dictionaries keyed by identifier for easier comparison
         # Try common identifier fields
-        identifier_fields = [
-            "interface",
-            "name",
-            "network",
-            "destination",
-            "address",
-            "neighbor",
-            "mac_address",
-        ]
+        identifier_fields = BaselineComparator.IDENTIFIER_FIELDS
 
         old_dict = {}
         new_dict = {}
@@ -4,7 +4,7 @@ Device communication service for connecting to network devices using netmiko.
 
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from netmiko import (
     ConnectHandler,
     NetmikoTimeoutException,
@@ -115,36 +115,9 @@ class DeviceCommunicationService:
             # Create netmiko connection
             with ConnectHandler(**device_config) as connection:
                 # Send command and get output
-                if parser and parser.upper() in ["TEXTFSM", "TTP"]:
-                    # Use netmiko's structured output parsing
-                    output = connection.send_command(
-                        command,
-                        delay_factor=self.global_delay_factor,
-                        max_loops=self.max_loops,
-                        use_textfsm=True if parser.upper() == "TEXTFSM" else False,
-                        use_ttp=True if parser.upper() == "TTP" else False,
-                    )
-                    parsed_output = True
-
-                    # If TextFSM parsing was requested but returned a string (parsing failed or no data),
-                    # and the string appears to be raw output, return an empty list instead
-                    if isinstance(output, str) and output.strip():
-                        logger.warning(
-                            f"TextFSM parsing returned raw output for command '{command}' on {device_dict['name']}. "
-                            "This likely means no matching template was found or no data matched. Returning empty list."
-                        )
-                        output = []
-                    elif isinstance(output, str) and not output.strip():
-                        # Empty string means no output, return empty list
-                        output = []
-                else:
-                    # Send command without parsing
-                    output = connection.send_command(
-                        command,
-                        delay_factor=self.global_delay_factor,
-                        max_loops=self.max_loops,
-                    )
-                    parsed_output = False
+                output, parsed_output = self._send_command(
+                    connection, command, parser, device_dict["name"]
+                )
 
                 execution_time = time.time() - start_time
 
@@ -205,6 +178,144 @@ class DeviceCommunicationService:
                 "execution_time": execution_time,
             }
 
+    async def execute_commands(
+        self,
+        device_info,  # Can be DeviceConnectionInfo or Dict
+        commands: List[str],
+        username: str,
+        parser: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute several commands on a network device over a single connection.
+
+        The SSH session is opened and authenticated once and every command is
+        sent over it, instead of paying the connection setup per command.
+
+        Returns:
+            Dictionary mapping each command to a result dict in the same format
+            as execute_command. If the connection itself fails, every command
+            maps to the same failure result.
+        """
+        start_time = time.time()
+        results: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            # Convert Pydantic model to dict if needed
+            if hasattr(device_info, "model_dump"):
+                device_dict = device_info.model_dump()
+            else:
+                device_dict = device_info
+
+            # Get device credentials
+            device_config = await self._get_device_config(device_dict, username)
+
+            logger.info(
+                f"Connecting to device {device_dict['name']} ({device_dict['primary_ip']}) to execute {len(commands)} commands"
+            )
+
+            with ConnectHandler(**device_config) as connection:
+                for command in commands:
+                    command_start = time.time()
+                    try:
+                        output, parsed_output = self._send_command(
+                            connection, command, parser, device_dict["name"]
+                        )
+                        results[command] = {
+                            "success": True,
+                            "output": output,
+                            "parsed": parsed_output,
+                            "parser_used": parser,
+                            "execution_time": time.time() - command_start,
+                        }
+                    except Exception as e:
+                        error_msg = f"Error executing command on device {device_dict.get('name', 'unknown')}: {str(e)}"
+                        logger.error(error_msg)
+                        results[command] = {
+                            "success": False,
+                            "error": error_msg,
+                            "error_type": "general_error",
+                            "execution_time": time.time() - command_start,
+                        }
+
+            logger.info(
+                f"Executed {len(commands)} commands on {device_dict['name']} in {time.time() - start_time:.2f}s (parser: {parser or 'none'})"
+            )
+            return results
+
+        except NetmikoTimeoutException as e:
+            error_msg = f"Timeout connecting to device {device_dict.get('name', 'unknown')}: {str(e)}"
+            logger.error(error_msg)
+            failure = {"success": False, "error": error_msg, "error_type": "timeout"}
+
+        except NetmikoAuthenticationException as e:
+            logger.error(
+                f"Authentication failed for device {device_dict.get('name', 'unknown')}: {str(e)}"
+            )
+            failure = {
+                "success": False,
+                "error": "Login failed. Please check your credentials in Settings.",
+                "error_type": "authentication_failed",
+            }
+
+        except Exception as e:
+            error_str = str(e)
+            if "No valid credentials found" in error_str:
+                error_msg = "No valid credentials found. Please add TACACS or SSH credentials in Settings."
+                error_type = "no_credentials"
+            else:
+                error_msg = f"Error executing commands on device {device_dict.get('name', 'unknown')}: {error_str}"
+                error_type = "general_error"
+
+            logger.error(error_msg)
+            logger.exception("Full exception details:")
+            failure = {"success": False, "error": error_msg, "error_type": error_type}
+
+        # Connection-level failure: report it for every command not yet executed
+        failure["execution_time"] = time.time() - start_time
+        for command in commands:
+            results.setdefault(command, dict(failure))
+        return results
+
+    def _send_command(
+        self, connection, command: str, parser: Optional[str], device_name: str
+    ) -> Tuple[Any, bool]:
+        """
+        Send a command over an open netmiko connection.
+
+        Returns:
+            Tuple of (output, parsed) where parsed indicates structured parsing
+        """
+        if parser and parser.upper() in ["TEXTFSM", "TTP"]:
+            # Use netmiko's structured output parsing
+            output = connection.send_command(
+                command,
+                delay_factor=self.global_delay_factor,
+                max_loops=self.max_loops,
+                use_textfsm=True if parser.upper() == "TEXTFSM" else False,
+                use_ttp=True if parser.upper() == "TTP" else False,
+            )
+
+            # If TextFSM parsing was requested but returned a string (parsing failed or no data),
+            # and the string appears to be raw output, return an empty list instead
+            if isinstance(output, str) and output.strip():
+                logger.warning(
+                    f"TextFSM parsing returned raw output for command '{command}' on {device_name}. "
+                    "This likely means no matching template was found or no data matched. Returning empty list."
+                )
+                output = []
+            elif isinstance(output, str) and not output.strip():
+                # Empty string means no output, return empty list
+                output = []
+            return output, True
+
+        # Send command without parsing
+        output = connection.send_command(
+            command,
+            delay_factor=self.global_delay_factor,
+            max_loops=self.max_loops,
+        )
+        return output, False
+
     async def _get_device_config(
         self, device_info: Dict[str, Any], username: str
     ) -> Dict[str, Any]:
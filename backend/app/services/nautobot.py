@@ -2,9 +2,12 @@
 Nautobot service for handling GraphQL queries and REST API calls.
 """
 
+import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional, Tuple, List
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional, Tuple, List
 from ..core.config import settings
 from ..core.cache import cache_service
 
@@ -16,6 +19,48 @@ class NautobotService:
 
     def __init__(self):
         self.config_cache = None
+        # Pooled clients per verify_ssl for the long-lived event loops passed
+        # to pool_clients(); a client's connections belong to its loop
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def pool_clients(self, loop: asyncio.AbstractEventLoop):
+        """Reuse keep-alive HTTP clients for requests made on a long-lived loop.
+
+        Requests on that loop then reuse their TCP/TLS connections to Nautobot
+        instead of opening new ones. Requests on any other loop (e.g. one
+        created by asyncio.run) use a client that is closed after the request.
+
+        Args:
+            loop: Event loop that stays open across requests
+        """
+        self._clients.setdefault(loop, {})
+
+    @asynccontextmanager
+    async def _client(self, verify_ssl: bool) -> AsyncIterator[httpx.AsyncClient]:
+        """Get an HTTP client for a request on the running event loop.
+
+        Args:
+            verify_ssl: Whether to verify the server certificate
+
+        Yields:
+            The loop's pooled httpx.AsyncClient, or a per-request client
+        """
+        pooled = self._clients.get(asyncio.get_running_loop())
+        if pooled is None:
+            async with httpx.AsyncClient(verify=verify_ssl) as client:
+                yield client
+            return
+
+        client = pooled.get(verify_ssl)
+        if client is None or client.is_closed:
+            client = pooled[verify_ssl] = httpx.AsyncClient(verify=verify_ssl)
+        yield client
+
+    async def close(self):
+        """Close the pooled HTTP clients of the running event loop."""
+        pooled = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in pooled.values():
+            await client.aclose()
 
     def _get_config(self, username: Optional[str] = None) -> Dict[str, Any]:
         """Get Nautobot configuration from database or global settings."""
@@ -88,7 +133,7 @@ class NautobotService:
         payload = {"query": query, "variables": variables or {}}
 
         try:
-            async with httpx.AsyncClient(verify=config["verify_ssl"]) as client:
+            async with self._client(config["verify_ssl"]) as client:
                 response = await client.post(
                     graphql_url,
                     json=payload,
@@ -135,7 +180,7 @@ class NautobotService:
         }
 
         try:
-            async with httpx.AsyncClient(verify=config["verify_ssl"]) as client:
+            async with self._client(config["verify_ssl"]) as client:
                 if method.upper() == "GET":
                     response = await client.get(
                         api_url,
@@ -31,75 +31,91 @@ from .base import TopologyDiscoveryBase
 logger = logging.getLogger(__name__)
 
 
+class DeviceLookupError(Exception):
+    """Raised when a device cannot be prepared for command execution."""
+
+
 class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
     """Sync topology discovery service for Celery/background execution."""
 
     @staticmethod
-    def _call_device_endpoint_sync(
-        device_id: str, endpoint: str, auth_token: str
-    ) -> Dict[str, Any]:
+    def _call_device_endpoints_sync(
+        device_id: str, endpoints: List[str], auth_token: str
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Direct device command execution for Celery workers (no HTTP calls).
 
         This method uses direct SSH communication via DeviceCommunicationService,
         bypassing any HTTP layers. Perfect for Celery workers that need to scale
-        independently.
+        independently. Commands with valid cached output are served from the
+        JSON cache; all others run over a single SSH session, after looking the
+        device up in Nautobot once.
 
         Args:
             device_id: The device ID
-            endpoint: The endpoint path (e.g., 'cdp-neighbors', 'ip-route/static')
+            endpoints: Endpoint paths (e.g., 'cdp-neighbors', 'ip-route/static')
             auth_token: Authentication token (used to extract username)
 
         Returns:
-            Command execution result as dict with 'success' and 'output' keys
+            Dictionary mapping each endpoint to a command execution result dict
+            with 'success' and 'output' keys
         """
+        import json
+        from ...core.database import SessionLocal
+        from ...services.json_cache_service import JSONCacheService
+
+        commands = {
+            endpoint: SyncTopologyDiscoveryService._get_device_command(endpoint)
+            for endpoint in endpoints
+        }
+        results: Dict[str, Dict[str, Any]] = {}
+
         try:
             # Extract username from token
             username = SyncTopologyDiscoveryService._get_username_from_token(auth_token)
 
-            # Get the command for this endpoint
-            command = SyncTopologyDiscoveryService._get_device_command(endpoint)
-
-            # Define async function to get device info and execute command
-            async def execute_device_command():
-                # Check JSON blob cache first for any command
+            # Check JSON blob cache first for every command
+            try:
+                db = SessionLocal()
                 try:
-                    import json
-                    from ...core.database import SessionLocal
-                    from ...services.json_cache_service import JSONCacheService
-
-                    db = SessionLocal()
-                    try:
+                    for endpoint, command in commands.items():
                         valid_cache = JSONCacheService.get_valid_cache(
                             db=db, device_id=device_id, command=command
                         )
-
                         if valid_cache:
-                            # Use cached data
-                            cached_output = json.loads(valid_cache.json_data)
                             logger.info(
                                 f"✅ Using cached data for device {device_id}, command '{command}' (endpoint: {endpoint})"
                             )
-                            return {
+                            results[endpoint] = {
                                 "success": True,
-                                "output": cached_output,
+                                "output": json.loads(valid_cache.json_data),
                                 "parsed": True,
                                 "parser_used": "TEXTFSM (from cache)",
                                 "execution_time": 0.0,
                                 "cached": True,
                             }
-                    finally:
-                        db.close()
-                except Exception as cache_error:
-                    logger.warning(
-                        f"Failed to check cache for device {device_id}, command '{command}', will execute: {str(cache_error)}"
-                    )
+                finally:
+                    db.close()
+            except Exception as cache_error:
+                logger.warning(
+                    f"Failed to check cache for device {device_id}, will execute: {str(cache_error)}"
+                )
+
+            pending = {
+                endpoint: command
+                for endpoint, command in commands.items()
+                if endpoint not in results
+            }
+            if not pending:
+                return results
 
+            # Define async function to get device info and execute commands
+            async def execute_device_commands():
                 # Get device info from Nautobot (returns raw GraphQL structure)
                 device_data = await nautobot_service.get_device(device_id, username)
                 if not device_data:
                     logger.error(f"Device {device_id} not found in Nautobot")
-                    return {"success": False, "error": "Device not found"}
+                    raise DeviceLookupError("Device not found")
 
                 # Transform device data to match expected structure
                 # The GraphQL response has nested structure, but DeviceCommunicationService
@@ -109,20 +125,18 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     logger.error(
                         f"Device {device_id} does not have a primary IPv4 address"
                     )
-                    return {
-                        "success": False,
-                        "error": "Device does not have a primary IPv4 address",
-                    }
+                    raise DeviceLookupError(
+                        "Device does not have a primary IPv4 address"
+                    )
 
                 platform_info = device_data.get("platform")
                 if not platform_info or not platform_info.get("network_driver"):
                     logger.error(
                         f"Device {device_id} does not have a platform/network_driver configured"
                     )
-                    return {
-                        "success": False,
-                        "error": "Device platform or network_driver not configured",
-                    }
+                    raise DeviceLookupError(
+                        "Device platform or network_driver not configured"
+                    )
 
                 # Create transformed device info with flattened structure
                 device_info = {
@@ -135,57 +149,65 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     "network_driver": platform_info["network_driver"],
                 }
 
-                # Execute command directly using DeviceCommunicationService
+                # Execute all commands over one connection
                 device_service = DeviceCommunicationService()
-                result = await device_service.execute_command(
+                return await device_service.execute_commands(
                     device_info=device_info,
-                    command=command,
+                    commands=list(dict.fromkeys(pending.values())),
                     username=username,
                     parser="TEXTFSM",
                 )
 
-                # Cache data after successful execution for any command
-                if (
-                    result.get("success")
-                    and result.get("parsed")
-                    and isinstance(result.get("output"), list)
-                ):
-                    try:
-                        import json
-                        from ...core.database import SessionLocal
-                        from ...services.json_cache_service import JSONCacheService
-
-                        db = SessionLocal()
-                        try:
-                            json_data = json.dumps(result["output"])
-                            JSONCacheService.set_cache(
-                                db=db,
-                                device_id=device_id,
-                                command=command,
-                                json_data=json_data,
-                            )
-                            logger.info(
-                                f"✅ Cached data for device {device_id}, command '{command}' (endpoint: {endpoint})"
-                            )
-                        finally:
-                            db.close()
-                    except Exception as cache_error:
-                        logger.error(
-                            f"Failed to cache data for device {device_id}, command '{command}': {str(cache_error)}"
+            # Use asyncio.run for sync context (Celery worker)
+            try:
+                command_results = asyncio.run(execute_device_commands())
+            except DeviceLookupError as e:
+                # Device lookup failed: same error for every command
+                for endpoint in pending:
+                    results[endpoint] = {"success": False, "error": str(e)}
+                return results
+
+            for endpoint, command in pending.items():
+                results[endpoint] = command_results[command]
+
+            # Cache data after successful execution for any command
+            try:
+                db = SessionLocal()
+                try:
+                    for endpoint, command in pending.items():
+                        result = results[endpoint]
+                        if not (
+                            result.get("success")
+                            and result.get("parsed")
+                            and isinstance(result.get("output"), list)
+                        ):
+                            continue
+                        JSONCacheService.set_cache(
+                            db=db,
+                            device_id=device_id,
+                            command=command,
+                            json_data=json.dumps(result["output"]),
                         )
+                        logger.info(
+                            f"✅ Cached data for device {device_id}, command '{command}' (endpoint: {endpoint})"
+                        )
+                finally:
+                    db.close()
+            except Exception as cache_error:
+                logger.error(
+                    f"Failed to cache data for device {device_id}: {str(cache_error)}"
+                )
 
-                return result
-
-            # Use asyncio.run for sync context (Celery worker)
-            result = asyncio.run(execute_device_command())
-            return result
+            return results
 
         except Exception as e:
             logger.error(
-                f"Direct device call failed for {device_id}/{endpoint}: {e}",
+                f"Direct device call failed for {device_id}: {e}",
                 exc_info=True,
             )
-            return {"success": False, "error": str(e)}
+            for endpoint in endpoints:
+                results.setdefault(endpoint, {"success": False, "error": str(e)})
+            return results
 
     @staticmethod
     def discover_device_data_sync(
@@ -297,6 +319,31 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     )
                     # Continue anyway - caching will fail but data will still be returned
 
+            # Collect all requested tables from the device in one go
+            endpoints = [
+                endpoint
+                for endpoint, included in (
+                    ("ip-route/static", include_static_routes),
+                    ("ip-route/ospf", include_ospf_routes),
+                    ("ip-route/bgp", include_bgp_routes),
+                    ("mac-address-table", include_mac_table),
+                    ("cdp-neighbors", include_cdp_neighbors),
+                    ("ip-arp", include_arp),
+                    ("interfaces", include_interfaces),
+                )
+                if included
+            ]
+            task.update_state(
+                state="PROGRESS",
+                meta={
+                    "progress": 0,
+                    "current_task": f"Executing {len(endpoints)} commands on device",
+                },
+            )
+            results = SyncTopologyDiscoveryService._call_device_endpoints_sync(
+                device_id=device_id, endpoints=endpoints, auth_token=auth_token
+            )
+
             # Static Routes
             if include_static_routes:
                 task.update_state(
@@ -307,14 +354,7 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     },
                 )
                 try:
-                    logger.info(
-                        f"📍 Executing command for static routes on device {device_id}"
-                    )
-                    result = SyncTopologyDiscoveryService._call_device_endpoint_sync(
-                        device_id=device_id,
-                        endpoint="ip-route/static",
-                        auth_token=auth_token,
-                    )
+                    result = results["ip-route/static"]
                     logger.info(
                         f"📍 Result: success={result.get('success')}, "
                         f"output type={type(result.get('output'))}"
@@ -352,11 +392,7 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     },
                 )
                 try:
-                    result = SyncTopologyDiscoveryService._call_device_endpoint_sync(
-                        device_id=device_id,
-                        endpoint="ip-route/ospf",
-                        auth_token=auth_token,
-                    )
+                    result = results["ip-route/ospf"]
                     if result.get("success") and isinstance(result.get("output"), list):
                         device_data["ospf_routes"] = result["output"]
 
@@ -380,11 +416,7 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     },
                 )
                 try:
-                    result = SyncTopologyDiscoveryService._call_device_endpoint_sync(
-                        device_id=device_id,
-                        endpoint="ip-route/bgp",
-                        auth_token=auth_token,
-                    )
+                    result = results["ip-route/bgp"]
                     if result.get("success") and isinstance(result.get("output"), list):
                         device_data["bgp_routes"] = result["output"]
 
@@ -408,11 +440,7 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     },
                 )
                 try:
-                    result = SyncTopologyDiscoveryService._call_device_endpoint_sync(
-                        device_id=device_id,
-                        endpoint="mac-address-table",
-                        auth_token=auth_token,
-                    )
+                    result = results["mac-address-table"]
                     if result.get("success") and isinstance(result.get("output"), list):
                         device_data["mac_table"] = result["output"]
 
@@ -436,11 +464,7 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     },
                 )
                 try:
-                    result = SyncTopologyDiscoveryService._call_device_endpoint_sync(
-                        device_id=device_id,
-                        endpoint="cdp-neighbors",
-                        auth_token=auth_token,
-                    )
+                    result = results["cdp-neighbors"]
                     if result.get("success") and isinstance(result.get("output"), list):
                         device_data["cdp_neighbors"] = result["output"]
 
@@ -464,12 +488,7 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     },
                 )
                 try:
-                    logger.info(
-                        f"📍 Executing command for ARP entries on device {device_id}"
-                    )
-                    result = SyncTopologyDiscoveryService._call_device_endpoint_sync(
-                        device_id=device_id, endpoint="ip-arp", auth_token=auth_token
-                    )
+                    result = results["ip-arp"]
                     logger.info(
                         f"📍 ARP Result: success={result.get('success')}, "
                         f"output type={type(result.get('output'))}"
@@ -507,14 +526,7 @@ class SyncTopologyDiscoveryService(TopologyDiscoveryBase):
                     },
                 )
                 try:
-                    logger.info(
-                        f"📍 Executing command for interfaces on device {device_id}"
-                    )
-                    result = SyncTopologyDiscoveryService._call_device_endpoint_sync(
-                        device_id=device_id,
-                        endpoint="interfaces",
-                        auth_token=auth_token,
-                    )
+                    result = results["interfaces"]
                     logger.info(
                         f"📍 Interfaces Result: success={result.get('success')}, "
                         f"output type={type(result.get('output'))}"
@@ -7,19 +7,54 @@ checking, and change management.
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import re
 import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
-from sqlalchemy import and_
+from sqlalchemy import and_, update
+
+from ..core.cache import SNAPSHOT_COMMANDS_CACHE_KEY
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Above this many devices, per-device tasks are published in chunks of
+# DISPATCH_CHUNK_SIZE devices (one message per chunk) instead of one message
+# per device, so enqueueing large runs does not cost one broker round-trip
+# per device.
+DISPATCH_CHUNK_THRESHOLD = 200
+DISPATCH_CHUNK_SIZE = 50
+
+# Batched device tasks commit once per this many devices; each device is
+# still isolated in its own SAVEPOINT
+SNAPSHOT_COMMIT_EVERY = 25
+
+# Trailing numeric ID of a periodic task name (e.g. "celery.backend_cleanup_123")
+PERIODIC_TASK_ID_RE = re.compile(r"_(\d+)$")
+
+# TTL of the snapshot commands cached under SNAPSHOT_COMMANDS_CACHE_KEY
+SNAPSHOT_COMMANDS_CACHE_TTL = 3600
+
+# Inventory definitions resolve against live Nautobot data, so their device
+# lists are only cached for a short time
+INVENTORY_DEVICES_CACHE_TTL = 300
+
 
 def register_tasks(celery_app):
     """Register baseline tasks with the Celery app."""
+    from celery import chord, group
 
     def _execute_snapshot_task(
         task_self,
@@ -44,6 +79,12 @@ def register_tasks(celery_app):
         to the appropriate CommandPlatform enum. Only snapshot commands matching the
         device's platform are executed.
 
+        This task resolves the devices and their commands, then replaces itself with
+        a chord of one snapshot_device task per device and an
+        aggregate_snapshot_results callback, so devices are processed in parallel
+        across workers. The callback inherits this task's ID, so the aggregated
+        result is reported under the original job ID.
+
         Snapshot Types:
         - "baseline": Long-term reference snapshot, typically taken once and stored for comparison
         - "snapshot": Current state snapshot, typically used for comparison against baseline
@@ -67,21 +108,20 @@ def register_tasks(celery_app):
                 - snapshot_ids: List of created snapshot record IDs
         """
         from ..core.database import SessionLocal
-        from ..models.device_cache import Snapshot, SnapshotType
+        from ..models.device_cache import SnapshotType
         from ..models.inventory import Inventory
         from ..models.settings import DeviceCommand, CommandType, CommandPlatform
+        from ..core.cache import cache_service
         from ..services.nautobot import nautobot_service
-        from ..services.device_communication import DeviceCommunicationService
         from ..services.inventory import InventoryService
         from ..services.task_security import validate_task_username
         from ..schemas.inventory import LogicalOperation
 
-        # Validate and convert snapshot_type parameter
-        if snapshot_type.lower() == "baseline":
-            snapshot_type_enum = SnapshotType.BASELINE
-        elif snapshot_type.lower() == "snapshot":
-            snapshot_type_enum = SnapshotType.SNAPSHOT
-        else:
+        # Validate snapshot_type parameter
+        if snapshot_type.lower() not in (
+            SnapshotType.BASELINE.value,
+            SnapshotType.SNAPSHOT.value,
+        ):
             raise ValueError(
                 f"Invalid snapshot_type: {snapshot_type}. Must be 'baseline' or 'snapshot'"
             )
@@ -103,6 +143,16 @@ def register_tasks(celery_app):
             # Initialize database session
             db = SessionLocal()
 
+            # Event loop for all async calls made by this task invocation
+            loop = _get_event_loop()
+
+            # Connect the shared Redis cache on this loop so Nautobot device
+            # lookups are served from its TTL cache across task runs
+            cache_connected_here = False
+            if not cache_service.redis:
+                loop.run_until_complete(cache_service.connect())
+                cache_connected_here = cache_service.redis is not None
+
             try:
                 # Security validation: Verify username matches task owner
                 # Get periodic_task_id from Celery request context if available
@@ -119,9 +169,7 @@ def register_tasks(celery_app):
                         )
                         if periodic_task_id:
                             # Extract numeric ID if it's in format "celery.backend_cleanup_123"
-                            import re
-
-                            match = re.search(r"_(\d+)$", str(periodic_task_id))
+                            match = PERIODIC_TASK_ID_RE.search(str(periodic_task_id))
                             if match:
                                 periodic_task_id = int(match.group(1))
                             else:
@@ -163,24 +211,45 @@ def register_tasks(celery_app):
                     if not inventory:
                         raise ValueError(f"Inventory {inventory_id} not found")
 
-                    # Parse operations from JSON
-                    operations_data = json.loads(inventory.operations_json)
-                    operations = [LogicalOperation(**op) for op in operations_data]
+                    # Resolved device IDs are cached briefly, keyed by the
+                    # inventory definition and its last update, so repeated
+                    # scheduled runs skip re-evaluating the same operations
+                    inventory_cache_key = cache_service.generate_key(
+                        "baseline",
+                        "inventory_devices",
+                        id=inventory.id,
+                        ops=hashlib.blake2b(
+                            inventory.operations_json.encode(), digest_size=16
+                        ).hexdigest(),
+                        updated=inventory.updated_at.timestamp()
+                        if inventory.updated_at
+                        else None,
+                    )
+                    device_ids = loop.run_until_complete(
+                        cache_service.get(inventory_cache_key)
+                    )
 
-                    # Use inventory service to preview devices
-                    inventory_service = InventoryService()
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
+                    if device_ids is None:
+                        # Parse operations from JSON
+                        operations_data = json.loads(inventory.operations_json)
+                        operations = [LogicalOperation(**op) for op in operations_data]
+
+                        # Use inventory service to preview devices
+                        inventory_service = InventoryService()
                         devices_list, ops_count = loop.run_until_complete(
                             inventory_service.preview_inventory(operations)
                         )
                         device_ids = [d.id for d in devices_list]
-                        logger.info(
-                            f"Resolved inventory '{inventory.name}' to {len(device_ids)} devices"
+                        loop.run_until_complete(
+                            cache_service.set(
+                                inventory_cache_key,
+                                device_ids,
+                                ttl=INVENTORY_DEVICES_CACHE_TTL,
+                            )
                         )
-                    finally:
-                        loop.close()
+                    logger.info(
+                        f"Resolved inventory '{inventory.name}' to {len(device_ids)} devices"
+                    )
 
                     if not device_ids:
                         logger.warning(
@@ -207,54 +276,66 @@ def register_tasks(celery_app):
                         },
                     )
 
-                    # Run async function in event loop
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        devices_result = loop.run_until_complete(
-                            nautobot_service.get_devices_async(
-                                task_username, limit=1000
-                            )
-                        )
-                        device_ids = [
-                            d["id"] for d in devices_result.get("devices", [])
-                        ]
-                    finally:
-                        loop.close()
+                    devices_result = loop.run_until_complete(
+                        nautobot_service.get_devices_async(task_username, limit=1000)
+                    )
+                    device_ids = [d["id"] for d in devices_result.get("devices", [])]
 
                 total_devices = len(device_ids)
                 logger.info(f"Baselining {total_devices} devices")
 
-                devices_processed = 0
-                total_commands_executed = 0
                 errors = []
-                baseline_ids = []
+                device_jobs = []
 
-                # Process each device
-                for device_index, device_id in enumerate(device_ids):
-                    try:
-                        # Update progress
-                        progress = 10 + int((device_index / total_devices) * 80)
-                        task_self.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "current": progress,
-                                "total": 100,
-                                "status": f"Processing device {device_index + 1}/{total_devices}",
-                                "devices_processed": devices_processed,
-                                "total_commands_executed": total_commands_executed,
+                # Fetch metadata for all devices up front with bounded concurrency
+                task_self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": 8,
+                        "total": 100,
+                        "status": f"Fetching metadata for {total_devices} devices from Nautobot",
+                    },
+                )
+                device_data_map = loop.run_until_complete(
+                    _fetch_device_data(nautobot_service, device_ids, task_username)
+                )
+
+                # Load snapshot commands for all platforms once, grouped by
+                # platform, from the Redis cache or else from the database
+                cached_commands = loop.run_until_complete(
+                    cache_service.get(SNAPSHOT_COMMANDS_CACHE_KEY)
+                )
+                if cached_commands:
+                    commands_by_platform = {
+                        CommandPlatform(platform): platform_commands
+                        for platform, platform_commands in cached_commands.items()
+                    }
+                else:
+                    commands_by_platform = defaultdict(list)
+                    for platform, command in (
+                        db.query(DeviceCommand.platform, DeviceCommand.command)
+                        .filter(DeviceCommand.type == CommandType.SNAPSHOT)
+                        .all()
+                    ):
+                        commands_by_platform[platform].append(command)
+                    loop.run_until_complete(
+                        cache_service.set(
+                            SNAPSHOT_COMMANDS_CACHE_KEY,
+                            {
+                                platform.value: platform_commands
+                                for platform, platform_commands in commands_by_platform.items()
                             },
+                            ttl=SNAPSHOT_COMMANDS_CACHE_TTL,
                         )
+                    )
 
+                # Resolve each device to connection info and commands to run
+                for device_id in device_ids:
+                    try:
                         # Get device info from Nautobot
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            device_data = loop.run_until_complete(
-                                nautobot_service.get_device(device_id, task_username)
-                            )
-                        finally:
-                            loop.close()
+                        device_data = device_data_map.get(device_id)
+                        if isinstance(device_data, Exception):
+                            raise device_data
 
                         if not device_data:
                             error_msg = f"Device {device_id} not found in Nautobot"
@@ -303,46 +384,24 @@ def register_tasks(celery_app):
                         # Get platform-specific snapshot commands from database
                         device_platform_name = platform_info.get("name", "")
 
-                        # Map Nautobot platform names to CommandPlatform enum
-                        # Order matters: check more specific patterns first (e.g., "ios xe" before "ios")
-                        platform_mapping = [
-                            (
-                                ["cisco_xe", "ios-xe", "iosxe", "ios xe"],
-                                CommandPlatform.IOS_XE,
-                            ),
-                            (
-                                ["cisco_nxos", "nxos", "nx-os", "nexus"],
-                                CommandPlatform.NEXUS,
-                            ),
-                            (["cisco_ios", "ios"], CommandPlatform.IOS),
-                        ]
-
                         # Try to match platform (case-insensitive)
-                        # Check more specific patterns first
-                        command_platform = None
-                        device_platform_lower = device_platform_name.lower()
-                        for patterns, platform_enum in platform_mapping:
-                            if any(
-                                pattern in device_platform_lower for pattern in patterns
-                            ):
-                                command_platform = platform_enum
-                                break
+                        platform_value = _match_command_platform(
+                            device_platform_name.lower()
+                        )
+                        command_platform = (
+                            CommandPlatform(platform_value) if platform_value else None
+                        )
 
                         # load commands from database
                         if command_platform:
-                            # Load snapshot commands for this platform from database
-                            snapshot_commands = (
-                                db.query(DeviceCommand)
-                                .filter(
-                                    DeviceCommand.type == CommandType.SNAPSHOT,
-                                    DeviceCommand.platform == command_platform,
-                                )
-                                .all()
+                            commands_to_run = commands_by_platform.get(
+                                command_platform, []
                             )
-                            commands_to_run = [cmd.command for cmd in snapshot_commands]
-                            logger.info(
-                                f"Device {device_name} (platform: {command_platform.value}): "
-                                f"Loaded {len(commands_to_run)} snapshot commands from database"
+                            logger.debug(
+                                "Device %s (platform: %s): Loaded %d snapshot commands",
+                                device_name,
+                                command_platform.value,
+                                len(commands_to_run),
                             )
                         else:
                             # No matching platform found
@@ -363,225 +422,467 @@ def register_tasks(celery_app):
                             )
                             continue
 
-                        # Execute each command and store baseline
-                        device_service = DeviceCommunicationService()
-                        device_commands_executed = 0
+                        device_jobs.append((device_info, commands_to_run))
+
+                    except Exception as device_error:
+                        error_msg = f"Error processing device: {str(device_error)}"
+                        logger.error(f"Device {device_id}: {error_msg}", exc_info=True)
+                        errors.append({"device_id": device_id, "error": error_msg})
+
+            finally:
+                if cache_connected_here:
+                    loop.run_until_complete(cache_service.disconnect())
+                db.close()
+
+        except Exception as e:
+            logger.error(f"Error in create_baseline task: {str(e)}", exc_info=True)
+            task_self.update_state(
+                state="FAILURE",
+                meta={
+                    "error": str(e),
+                    "status": "Failed to create baseline",
+                },
+            )
+            raise
+
+        if not device_jobs:
+            return _aggregate_snapshot_results([], total_devices, errors)
+
+        # Fan out one task per device. replace() ends this task, and the chord
+        # callback's result is stored under this task's ID.
+        task_self.update_state(
+            state="PROGRESS",
+            meta={
+                "current": 10,
+                "total": 100,
+                "status": f"Processing {len(device_jobs)}/{total_devices} devices in parallel",
+            },
+        )
+        device_args = [
+            (device_info, commands_to_run, task_username, snapshot_type.lower(), notes)
+            for device_info, commands_to_run in device_jobs
+        ]
+        if len(device_args) > DISPATCH_CHUNK_THRESHOLD:
+            # Each batch task runs its devices in turn with batched commits
+            header = group(
+                [
+                    snapshot_device_batch.s(
+                        device_args[index : index + DISPATCH_CHUNK_SIZE]
+                    )
+                    for index in range(0, len(device_args), DISPATCH_CHUNK_SIZE)
+                ]
+            )
+        else:
+            header = group([snapshot_device.s(*args) for args in device_args])
+
+        logger.info(
+            f"Dispatching {len(device_args)} device snapshot tasks "
+            f"in {len(header.tasks)} messages"
+        )
+        return task_self.replace(
+            chord(
+                header,
+                aggregate_snapshot_results.s(
+                    total_devices=total_devices, errors=errors
+                ),
+            )
+        )
 
-                        # Generate a unique group ID for this snapshot session
-                        # All commands executed in this session will share the same group_id
-                        snapshot_group_id = str(uuid.uuid4())
-                        logger.info(
-                            f"Device {device_name}: Generated snapshot_group_id: {snapshot_group_id}"
+    def _snapshot_device(
+        db,
+        loop,
+        device_info: Dict[str, Any],
+        commands: List[str],
+        username: str,
+        snapshot_type: str,
+        notes: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Execute snapshot commands on a single device and stage the results.
+
+        The device's rows are written inside a SAVEPOINT; committing is left
+        to the calling task.
+
+        Args:
+            db: Database session
+            loop: Event loop used for async calls
+            device_info: Device connection info (device_id, name, primary_ip,
+                platform, network_driver)
+            commands: Snapshot commands to execute
+            username: Validated username used for credential lookup
+            snapshot_type: "baseline" or "snapshot"
+            notes: Optional notes to store with the snapshot
+
+        Returns:
+            Dictionary with the device's results:
+                - device_id: Device ID
+                - commands_executed: Number of commands stored
+                - baseline_ids: IDs of created/updated snapshot records
+                - errors: List of errors encountered
+        """
+        from ..models.device_cache import Snapshot, SnapshotType
+        from ..services.device_communication import device_communication_service
+
+        snapshot_type_enum = SnapshotType(snapshot_type)
+        device_id = device_info["device_id"]
+        device_name = device_info["name"]
+        commands_to_run = commands
+
+        errors = []
+        baseline_ids = []
+        device_commands_executed = 0
+
+        try:
+            # Execute all commands over a single device connection before
+            # touching the database
+            command_results = loop.run_until_complete(
+                device_communication_service.execute_commands(
+                    device_info=device_info,
+                    commands=commands_to_run,
+                    username=username,
+                    parser="TEXTFSM",
+                )
+            )
+
+            # One timestamp for all rows written for this device
+            run_ts = datetime.now(timezone.utc)
+            run_ts_str = run_ts.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+            # The device's writes run in a SAVEPOINT so a failing device
+            # only rolls back its own rows; the caller commits
+            with db.begin_nested():
+                # New rows are collected and written with one multi-row
+                # INSERT ... RETURNING after the command loop instead of
+                # one ORM flush round-trip per command.
+                pending_rows = []
+
+                # Generate a unique group ID for this snapshot session
+                # All commands executed in this session will share the same group_id
+                snapshot_group_id = str(uuid.uuid4())
+                logger.debug(
+                    "Device %s: Generated snapshot_group_id: %s",
+                    device_name,
+                    snapshot_group_id,
+                )
+
+                # Baseline mode: load only the scalar columns of this device's
+                # existing baselines so the large output columns are never
+                # pulled into Python just to be overwritten
+                existing_baselines = {}
+                if snapshot_type_enum == SnapshotType.BASELINE:
+                    rows = (
+                        db.query(
+                            Snapshot.id,
+                            Snapshot.command,
+                            Snapshot.version,
+                            Snapshot.content_hash,
                         )
+                        .filter(
+                            and_(
+                                Snapshot.device_id == device_id,
+                                Snapshot.type == snapshot_type_enum,
+                                Snapshot.command.in_(commands_to_run),
+                            )
+                        )
+                        .all()
+                    )
+                    existing_baselines = {
+                        cmd: (snapshot_id, version, stored_hash)
+                        for snapshot_id, cmd, version, stored_hash in rows
+                    }
 
-                        for command in commands_to_run:
-                            try:
-                                # Execute command
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                                try:
-                                    result = loop.run_until_complete(
-                                        device_service.execute_command(
-                                            device_info=device_info,
-                                            command=command,
-                                            username=task_username,
-                                            parser="TEXTFSM",
-                                        )
-                                    )
-                                finally:
-                                    loop.close()
-
-                                if not result.get("success"):
-                                    error_msg = f"Command '{command}' failed: {result.get('error', 'Unknown error')}"
-                                    logger.warning(f"Device {device_name}: {error_msg}")
-                                    errors.append(
-                                        {
-                                            "device_id": device_id,
-                                            "device_name": device_name,
-                                            "command": command,
-                                            "error": error_msg,
-                                        }
-                                    )
-                                    continue
-
-                                # Get parsed output
-                                output = result.get("output")
-                                logger.info(
-                                    f"Device {device_name}: Command '{command}' - output type: {type(output)}, output value: {output}"
-                                )
+                for command in commands_to_run:
+                    try:
+                        result = command_results[command]
 
-                                if not output or not isinstance(output, list):
-                                    logger.warning(
-                                        f"Device {device_name}: Command '{command}' returned no structured data (not output={not output}, isinstance={isinstance(output, list)})"
-                                    )
-                                    continue
+                        if not result.get("success"):
+                            error_msg = f"Command '{command}' failed: {result.get('error', 'Unknown error')}"
+                            logger.warning(f"Device {device_name}: {error_msg}")
+                            errors.append(
+                                {
+                                    "device_id": device_id,
+                                    "device_name": device_name,
+                                    "command": command,
+                                    "error": error_msg,
+                                }
+                            )
+                            continue
+
+                        # Get parsed output
+                        output = result.get("output")
+
+                        if not output or not isinstance(output, list):
+                            logger.warning(
+                                f"Device {device_name}: Command '{command}' returned no structured data (output type: {type(output).__name__})"
+                            )
+                            continue
 
-                                logger.info(
-                                    f"Device {device_name}: Command '{command}' - passed validation, proceeding to serialize"
+                        # Serialize raw output and normalized version (timestamps,
+                        # counters, etc. removed) in a single pass
+                        (
+                            raw_output_json,
+                            normalized_output_json,
+                        ) = _serialize_raw_and_normalized(output, command)
+                        logger.debug(
+                            "Device %s: Command %r - raw/normalized JSON length: %d/%d",
+                            device_name,
+                            command,
+                            len(raw_output_json),
+                            len(normalized_output_json),
+                        )
+                        content_hash = _content_hash(normalized_output_json)
+
+                        # For baselines: check if one exists and update it
+                        # For snapshots: always create a new one (never update existing)
+                        if snapshot_type_enum == SnapshotType.BASELINE:
+                            # Baseline mode: Check if snapshot exists for this device/command/type
+                            existing = existing_baselines.get(command)
+
+                            if existing and existing[2] == content_hash:
+                                # Normalized output unchanged: keep the normalized
+                                # data and version, but refresh the raw output
+                                # (timestamps/counters still move) and notes
+                                existing_id, existing_version, _ = existing
+                                values = {
+                                    "raw_output": raw_output_json,
+                                    "updated_at": run_ts,
+                                }
+                                if notes:
+                                    values["notes"] = notes
+                                db.execute(
+                                    update(Snapshot)
+                                    .where(Snapshot.id == existing_id)
+                                    .values(**values)
                                 )
-                                # Serialize output to JSON
-                                raw_output_json = json.dumps(output, indent=2)
-                                logger.info(
-                                    f"Device {device_name}: Command '{command}' - raw_output_json length: {len(raw_output_json)}"
+                                baseline_ids.append(existing_id)
+                                logger.debug(
+                                    "Baseline for %s, command %r unchanged (version %s)",
+                                    device_name,
+                                    command,
+                                    existing_version,
                                 )
-
-                                # Create normalized version (remove timestamps, counters, etc.)
-                                normalized_output_json = _normalize_output(
-                                    output, command
+                            elif existing:
+                                # Update existing baseline with a direct UPDATE
+                                existing_id, existing_version, _ = existing
+                                new_version = (existing_version or 0) + 1
+                                values = {
+                                    "raw_output": raw_output_json,
+                                    "normalized_output": normalized_output_json,
+                                    "content_hash": content_hash,
+                                    "device_name": device_name,
+                                    "updated_at": run_ts,
+                                    "version": new_version,
+                                }
+                                if notes:
+                                    values["notes"] = notes
+                                db.execute(
+                                    update(Snapshot)
+                                    .where(Snapshot.id == existing_id)
+                                    .values(**values)
                                 )
-                                logger.info(
-                                    f"Device {device_name}: Command '{command}' - normalized_output_json length: {len(normalized_output_json)}"
+                                existing_baselines[command] = (
+                                    existing_id,
+                                    new_version,
+                                    content_hash,
                                 )
-
-                                # For baselines: check if one exists and update it
-                                # For snapshots: always create a new one (never update existing)
-                                if snapshot_type_enum == SnapshotType.BASELINE:
-                                    # Baseline mode: Check if snapshot exists for this device/command/type
-                                    logger.info(
-                                        f"Device {device_name}: Checking for existing baseline with device_id={device_id}, command={command}, type={snapshot_type_enum}"
-                                    )
-                                    existing_snapshot = (
-                                        db.query(Snapshot)
-                                        .filter(
-                                            and_(
-                                                Snapshot.device_id == device_id,
-                                                Snapshot.command == command,
-                                                Snapshot.type == snapshot_type_enum,
-                                            )
-                                        )
-                                        .first()
-                                    )
-                                    logger.info(
-                                        f"Device {device_name}: Existing baseline found: {existing_snapshot is not None}"
-                                    )
-
-                                    if existing_snapshot:
-                                        # Update existing baseline
-                                        existing_snapshot.raw_output = raw_output_json
-                                        existing_snapshot.normalized_output = (
-                                            normalized_output_json
-                                        )
-                                        existing_snapshot.device_name = device_name
-                                        existing_snapshot.updated_at = datetime.now(
-                                            timezone.utc
-                                        )
-                                        existing_snapshot.version += 1
-                                        if notes:
-                                            existing_snapshot.notes = notes
-                                        baseline_ids.append(existing_snapshot.id)
-                                        logger.info(
-                                            f"Updated baseline for {device_name}, command '{command}' (version {existing_snapshot.version})"
-                                        )
-                                    else:
-                                        # Create new baseline
-                                        new_snapshot = Snapshot(
-                                            device_id=device_id,
-                                            device_name=device_name,
-                                            command=command,
-                                            type=snapshot_type_enum,
-                                            raw_output=raw_output_json,
-                                            normalized_output=normalized_output_json,
-                                            snapshot_group_id=snapshot_group_id,
-                                            notes=notes
-                                            or f"Initial baseline created on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                                        )
-                                        db.add(new_snapshot)
-                                        db.flush()  # Get the ID
-                                        baseline_ids.append(new_snapshot.id)
-                                        logger.info(
-                                            f"Created new baseline for {device_name}, command '{command}'"
-                                        )
-                                else:
-                                    # Snapshot mode: Always create a new snapshot (never update)
-                                    logger.info(
-                                        f"Device {device_name}: Creating new snapshot (always creates new, never updates)"
-                                    )
-                                    new_snapshot = Snapshot(
-                                        device_id=device_id,
-                                        device_name=device_name,
-                                        command=command,
-                                        type=snapshot_type_enum,
-                                        raw_output=raw_output_json,
-                                        normalized_output=normalized_output_json,
-                                        snapshot_group_id=snapshot_group_id,
-                                        notes=notes
-                                        or f"Snapshot created on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                                    )
-                                    db.add(new_snapshot)
-                                    db.flush()  # Get the ID
-                                    baseline_ids.append(new_snapshot.id)
-                                    logger.info(
-                                        f"Created new snapshot for {device_name}, command '{command}' (ID: {new_snapshot.id})"
-                                    )
-
-                                device_commands_executed += 1
-                                total_commands_executed += 1
-
-                            except Exception as cmd_error:
-                                error_msg = f"Error executing command '{command}': {str(cmd_error)}"
-                                logger.error(
-                                    f"Device {device_name}: {error_msg}", exc_info=True
+                                baseline_ids.append(existing_id)
+                                logger.debug(
+                                    "Updated baseline for %s, command %r (version %s)",
+                                    device_name,
+                                    command,
+                                    new_version,
                                 )
-                                errors.append(
+                            else:
+                                # Create new baseline
+                                pending_rows.append(
                                     {
                                         "device_id": device_id,
                                         "device_name": device_name,
                                         "command": command,
-                                        "error": error_msg,
+                                        "type": snapshot_type_enum,
+                                        "raw_output": raw_output_json,
+                                        "normalized_output": normalized_output_json,
+                                        "content_hash": content_hash,
+                                        "snapshot_group_id": snapshot_group_id,
+                                        "notes": notes
+                                        or f"Initial baseline created on {run_ts_str}",
                                     }
                                 )
+                                logger.debug(
+                                    "Created new baseline for %s, command %r",
+                                    device_name,
+                                    command,
+                                )
+                        else:
+                            # Snapshot mode: Always create a new snapshot (never update)
+                            pending_rows.append(
+                                {
+                                    "device_id": device_id,
+                                    "device_name": device_name,
+                                    "command": command,
+                                    "type": snapshot_type_enum,
+                                    "raw_output": raw_output_json,
+                                    "normalized_output": normalized_output_json,
+                                    "content_hash": content_hash,
+                                    "snapshot_group_id": snapshot_group_id,
+                                    "notes": notes
+                                    or f"Snapshot created on {run_ts_str}",
+                                }
+                            )
+                            logger.debug(
+                                "Created new snapshot for %s, command %r",
+                                device_name,
+                                command,
+                            )
 
-                        # Commit after each device
-                        db.commit()
+                        device_commands_executed += 1
 
-                        if device_commands_executed > 0:
-                            devices_processed += 1
-                            logger.info(
-                                f"Completed baseline for device {device_name}: {device_commands_executed}/{len(commands_to_run)} commands successful"
-                            )
+                    except Exception as cmd_error:
+                        error_msg = (
+                            f"Error executing command '{command}': {str(cmd_error)}"
+                        )
+                        logger.error(
+                            f"Device {device_name}: {error_msg}", exc_info=True
+                        )
+                        errors.append(
+                            {
+                                "device_id": device_id,
+                                "device_name": device_name,
+                                "command": command,
+                                "error": error_msg,
+                            }
+                        )
 
-                    except Exception as device_error:
-                        db.rollback()
-                        error_msg = f"Error processing device: {str(device_error)}"
-                        logger.error(f"Device {device_id}: {error_msg}", exc_info=True)
-                        errors.append({"device_id": device_id, "error": error_msg})
+                # Insert all new rows for this device in one batch
+                if pending_rows:
+                    baseline_ids.extend(_insert_snapshot_rows(db, pending_rows))
 
-                # Final progress update
-                task_self.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "current": 100,
-                        "total": 100,
-                        "status": "Baseline creation completed",
-                    },
+            if device_commands_executed > 0:
+                logger.info(
+                    f"Completed baseline for device {device_name}: {device_commands_executed}/{len(commands_to_run)} commands successful"
+                )
+
+        except Exception as device_error:
+            error_msg = f"Error processing device: {str(device_error)}"
+            logger.error(f"Device {device_id}: {error_msg}", exc_info=True)
+            errors.append({"device_id": device_id, "error": error_msg})
+            # The device's savepoint was rolled back
+            device_commands_executed = 0
+            baseline_ids = []
+
+        return {
+            "device_id": device_id,
+            "commands_executed": device_commands_executed,
+            "baseline_ids": baseline_ids,
+            "errors": errors,
+        }
+
+    def _commit_device_results(db, device_results: List[Dict[str, Any]]) -> None:
+        """
+        Commit staged device results, marking them failed if the commit fails.
+
+        Args:
+            db: Database session
+            device_results: Results of the devices written since the last commit
+        """
+        try:
+            db.commit()
+        except Exception as commit_error:
+            db.rollback()
+            logger.error(
+                f"Error committing snapshots: {str(commit_error)}", exc_info=True
+            )
+            for device_result in device_results:
+                device_result["errors"].append(
+                    {
+                        "device_id": device_result["device_id"],
+                        "error": f"Error saving snapshots: {str(commit_error)}",
+                    }
                 )
+                device_result["commands_executed"] = 0
+                device_result["baseline_ids"] = []
 
-                result = {
-                    "status": "completed",
-                    "devices_processed": devices_processed,
-                    "total_devices": total_devices,
-                    "total_commands": total_commands_executed,
-                    "baseline_ids": baseline_ids,
-                    "errors": errors,
-                    "message": f"Successfully created/updated baselines for {devices_processed}/{total_devices} devices ({total_commands_executed} total commands)",
-                }
+    @celery_app.task(
+        bind=True, acks_late=True, name="app.tasks.baseline_tasks.snapshot_device"
+    )
+    def snapshot_device(
+        self,
+        device_info: Dict[str, Any],
+        commands: List[str],
+        username: str,
+        snapshot_type: str = "baseline",
+        notes: Optional[str] = None,
+    ):
+        """
+        Execute snapshot commands on a single device and store the results.
 
-                logger.info(f"Baseline creation completed: {result['message']}")
-                return result
+        See _snapshot_device for arguments and the returned dictionary.
+        """
+        from ..core.database import ScopedSession
 
-            finally:
-                db.close()
+        db = ScopedSession()
+        loop = _get_event_loop()
 
-        except Exception as e:
-            logger.error(f"Error in create_baseline task: {str(e)}", exc_info=True)
-            task_self.update_state(
-                state="FAILURE",
-                meta={
-                    "error": str(e),
-                    "status": "Failed to create baseline",
-                },
+        try:
+            device_result = _snapshot_device(
+                db, loop, device_info, commands, username, snapshot_type, notes
             )
-            raise
+            _commit_device_results(db, [device_result])
+            return device_result
+        finally:
+            ScopedSession.remove()
+
+    @celery_app.task(
+        bind=True,
+        acks_late=True,
+        name="app.tasks.baseline_tasks.snapshot_device_batch",
+    )
+    def snapshot_device_batch(self, device_args: List[List[Any]]):
+        """
+        Execute snapshot commands on a batch of devices in turn.
+
+        Each device is written in its own SAVEPOINT, and the session is
+        committed every SNAPSHOT_COMMIT_EVERY devices instead of after each
+        device.
+
+        Args:
+            device_args: snapshot_device arguments (device_info, commands,
+                username, snapshot_type, notes) for each device
+
+        Returns:
+            List of per-device result dictionaries
+        """
+        from ..core.database import ScopedSession
+
+        db = ScopedSession()
+        loop = _get_event_loop()
+
+        device_results = []
+        uncommitted = []
+        try:
+            for args in device_args:
+                device_result = _snapshot_device(db, loop, *args)
+                device_results.append(device_result)
+                uncommitted.append(device_result)
+                if len(uncommitted) >= SNAPSHOT_COMMIT_EVERY:
+                    _commit_device_results(db, uncommitted)
+                    uncommitted = []
+
+            _commit_device_results(db, uncommitted)
+            return device_results
+        finally:
+            ScopedSession.remove()
+
+    @celery_app.task(
+        acks_late=True, name="app.tasks.baseline_tasks.aggregate_snapshot_results"
+    )
+    def aggregate_snapshot_results(
+        device_results: List[Dict[str, Any]],
+        total_devices: int,
+        errors: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """Combine per-device snapshot results into the overall task result."""
+        return _aggregate_snapshot_results(device_results, total_devices, errors)
 
     @celery_app.task(bind=True, name="app.tasks.baseline_tasks.create_baseline")
     def create_baseline(
@@ -631,9 +932,224 @@ def register_tasks(celery_app):
     return {
         "create_baseline": create_baseline,
         "create_snapshot": create_snapshot,
+        "snapshot_device": snapshot_device,
+        "snapshot_device_batch": snapshot_device_batch,
+        "aggregate_snapshot_results": aggregate_snapshot_results,
     }
 
 
+# Event loop reused by all baseline tasks run in this worker process
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return this worker process's event loop, creating it on first use.
+
+    Tasks run async service calls on this loop with run_until_complete()
+    instead of creating and closing a new loop per task. Nautobot HTTP clients
+    are pooled on the loop; other clients bound to it (e.g. the Redis cache)
+    are still closed by the task that opened them.
+
+    Returns:
+        The worker process's event loop
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        from ..services.nautobot import nautobot_service
+
+        _worker_loop = asyncio.new_event_loop()
+        # Nautobot lookups of later tasks reuse this loop's connections
+        nautobot_service.pool_clients(_worker_loop)
+    asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+# Map Nautobot platform names to CommandPlatform values. Exact names are
+# looked up directly; anything else falls back to substring patterns.
+PLATFORM_EXACT = {
+    "cisco_xe": "IOS XE",
+    "ios-xe": "IOS XE",
+    "iosxe": "IOS XE",
+    "ios xe": "IOS XE",
+    "cisco_nxos": "Nexus",
+    "nxos": "Nexus",
+    "nx-os": "Nexus",
+    "nexus": "Nexus",
+    "cisco_ios": "IOS",
+    "ios": "IOS",
+}
+
+# Order matters: check more specific patterns first (e.g., "ios xe" before "ios")
+PLATFORM_PATTERNS = [
+    (re.compile("cisco_xe|ios-xe|iosxe|ios xe"), "IOS XE"),
+    (re.compile("cisco_nxos|nxos|nx-os|nexus"), "Nexus"),
+    (re.compile("cisco_ios|ios"), "IOS"),
+]
+
+
+def _match_command_platform(platform_name: str) -> Optional[str]:
+    """
+    Map a lower-cased Nautobot platform name to a CommandPlatform value.
+
+    Args:
+        platform_name: Lower-cased platform name
+
+    Returns:
+        CommandPlatform value, or None if the platform is not supported
+    """
+    platform_value = PLATFORM_EXACT.get(platform_name)
+    if platform_value:
+        return platform_value
+
+    for pattern, platform_value in PLATFORM_PATTERNS:
+        if pattern.search(platform_name):
+            return platform_value
+    return None
+
+
+def _aggregate_snapshot_results(
+    device_results: List[Dict[str, Any]],
+    total_devices: int,
+    errors: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Combine per-device snapshot results into the overall task result.
+
+    Args:
+        device_results: Results returned by snapshot_device tasks, or a list
+            of such result lists when the devices were dispatched in chunks
+        total_devices: Total number of devices attempted
+        errors: Errors collected before devices were dispatched
+
+    Returns:
+        Dictionary with snapshot creation results (see _execute_snapshot_task)
+    """
+    errors = list(errors or [])
+    baseline_ids = []
+    devices_processed = 0
+    total_commands_executed = 0
+
+    # Chunked dispatch returns one list of device results per chunk
+    if device_results and isinstance(device_results[0], list):
+        device_results = [
+            device_result for chunk in device_results for device_result in chunk
+        ]
+
+    for device_result in device_results:
+        errors.extend(device_result["errors"])
+        baseline_ids.extend(device_result["baseline_ids"])
+        total_commands_executed += device_result["commands_executed"]
+        if device_result["commands_executed"] > 0:
+            devices_processed += 1
+
+    result = {
+        "status": "completed",
+        "devices_processed": devices_processed,
+        "total_devices": total_devices,
+        "total_commands": total_commands_executed,
+        "baseline_ids": baseline_ids,
+        "errors": errors,
+        "message": f"Successfully created/updated baselines for {devices_processed}/{total_devices} devices ({total_commands_executed} total commands)",
+    }
+
+    logger.info(f"Baseline creation completed: {result['message']}")
+    return result
+
+
+SNAPSHOT_INSERT_COLUMNS = (
+    "device_id",
+    "device_name",
+    "command",
+    "type",
+    "raw_output",
+    "normalized_output",
+    "content_hash",
+    "snapshot_group_id",
+    "notes",
+    "version",
+)
+
+
+def _insert_snapshot_rows(db, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert new snapshot rows with psycopg2's execute_values.
+
+    This bypasses SQLAlchemy statement compilation for the bulk write and pages
+    the rows into multi-row INSERT ... RETURNING statements on the session's
+    connection, so the insert is part of the session's transaction.
+
+    Args:
+        db: Database session
+        rows: Snapshot column values keyed by column name (type as SnapshotType)
+
+    Returns:
+        IDs of the inserted rows, in insertion order
+    """
+    from psycopg2.extras import execute_values
+
+    values = [
+        (
+            row["device_id"],
+            row["device_name"],
+            row["command"],
+            # Enum(SnapshotType) stores member names
+            row["type"].name,
+            row["raw_output"],
+            row["normalized_output"],
+            row["content_hash"],
+            row["snapshot_group_id"],
+            row["notes"],
+            1,
+        )
+        for row in rows
+    ]
+    cursor = db.connection().connection.cursor()
+    try:
+        returned = execute_values(
+            cursor,
+            f"INSERT INTO snapshots ({', '.join(SNAPSHOT_INSERT_COLUMNS)}) "
+            "VALUES %s RETURNING id",
+            values,
+            page_size=500,
+            fetch=True,
+        )
+    finally:
+        cursor.close()
+    return [snapshot_id for (snapshot_id,) in returned]
+
+
+async def _fetch_device_data(
+    nautobot_service, device_ids: List[str], username: str, max_concurrency: int = 16
+) -> Dict[str, Any]:
+    """
+    Fetch Nautobot metadata for several devices concurrently.
+
+    Each distinct device ID is fetched once, even if it is listed repeatedly.
+
+    Args:
+        nautobot_service: Nautobot service used for the lookups
+        device_ids: Device IDs to fetch
+        username: Username for the Nautobot requests
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        Dictionary mapping device ID to device data, or to the exception raised
+        while fetching it
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(device_id: str):
+        async with semaphore:
+            return await nautobot_service.get_device(device_id, username)
+
+    unique_ids = list(dict.fromkeys(device_ids))
+    results = await asyncio.gather(
+        *(fetch(device_id) for device_id in unique_ids), return_exceptions=True
+    )
+    return dict(zip(unique_ids, results))
+
+
 def _get_username_from_token(auth_token: str) -> str:
     """
     Extract username from JWT token.
@@ -645,19 +1161,164 @@ def _get_username_from_token(auth_token: str) -> str:
         Username extracted from token, or 'admin' as fallback
     """
     try:
-        from jose import jwt
-        from ..core.config import settings
-
-        payload = jwt.decode(
-            auth_token, settings.secret_key, algorithms=[settings.algorithm]
-        )
-        return payload.get("sub", "admin")
+        username, expires_at = _decode_token_claims(auth_token)
     except Exception as e:
         logger.warning(f"Could not decode token: {e}, using default username 'admin'")
         return "admin"
 
+    if expires_at is not None and expires_at <= datetime.now(timezone.utc).timestamp():
+        logger.warning("Token has expired, using default username 'admin'")
+        return "admin"
+    return username
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_token_claims(auth_token: str) -> Tuple[str, Optional[float]]:
+    """
+    Verify a JWT token and return its subject and expiry, cached per token.
+
+    Signature verification is a pure function of the token, so it is memoized
+    per worker process. Expiry is time dependent and is therefore not checked
+    here but by the caller on every use.
+
+    Args:
+        auth_token: JWT authentication token
+
+    Returns:
+        Tuple of (username, expiry timestamp or None)
+    """
+    from jose import jwt
+    from ..core.config import settings
+
+    payload = jwt.decode(
+        auth_token,
+        settings.secret_key,
+        algorithms=[settings.algorithm],
+        options={"verify_exp": False},
+    )
+    return payload.get("sub", "admin"), payload.get("exp")
+
+
+# Identifier-like keys used to order normalized output, in order of preference
+NORMALIZE_SORT_KEYS = (
+    "interface",
+    "name",
+    "network",
+    "destination",
+    "neighbor",
+    "address",
+    "mac_address",
+)
+
+
+def _dumps(data: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize data to a compact JSON string, using orjson when available.
+
+    Args:
+        data: JSON-serializable data
+        sort_keys: Whether to sort dictionary keys
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    return json.dumps(data, sort_keys=sort_keys, separators=(",", ":"))
+
+
+def _serialize_raw_and_normalized(
+    output: List[Dict[str, Any]], command: str
+) -> Tuple[str, str]:
+    """
+    Serialize command output to raw and normalized JSON in one pass.
+
+    The raw JSON is written straight from the parsed output, and the normalized
+    JSON from a filtered view built by _normalize_output, so the output is
+    never deep-copied or serialized twice.
+
+    Args:
+        output: Parsed command output (list of dicts from TextFSM)
+        command: The command that was executed
+
+    Returns:
+        Tuple of (raw JSON string, normalized JSON string)
+    """
+    return _dumps(output), _dumps(_normalize_output(output, command), sort_keys=True)
 
-def _normalize_output(output: List[Dict[str, Any]], command: str) -> str:
+
+def _content_hash(normalized_json: str) -> str:
+    """
+    Compute a fingerprint of normalized output for change detection.
+
+    Args:
+        normalized_json: Normalized JSON string
+
+    Returns:
+        Hex digest of the normalized output
+    """
+    return hashlib.blake2b(normalized_json.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Fields to remove based on command type (these are dynamic and shouldn't affect baseline comparison)
+DYNAMIC_FIELDS = {
+    "show interfaces": [
+        "input_rate",
+        "output_rate",
+        "input_packets",
+        "output_packets",
+        "input_bytes",
+        "output_bytes",
+        "input_errors",
+        "output_errors",
+        "crc",
+        "collisions",
+        "interface_resets",
+        "last_input",
+        "last_output",
+        "last_clearing",
+        "queue_strategy",
+    ],
+    "show ip arp": ["age"],  # ARP age changes constantly
+    "show cdp neighbors": ["holdtime"],  # CDP holdtime counts down
+    "show mac address-table": [
+        # MAC table is generally stable, but we might want to remove port security counters
+    ],
+    "show ip route": [
+        # Routes are generally stable, but we could remove metric values if needed
+    ],
+}
+
+
+# Command patterns compiled into one alternation (one group per pattern, in
+# DYNAMIC_FIELDS order) with the field lists pre-built as frozensets
+DYNAMIC_FIELDS_PATTERN = re.compile(
+    "|".join(f"({re.escape(cmd_pattern)})" for cmd_pattern in DYNAMIC_FIELDS)
+)
+DYNAMIC_FIELD_SETS = [frozenset(fields) for fields in DYNAMIC_FIELDS.values()]
+
+
+@functools.lru_cache(maxsize=256)
+def _dynamic_fields_for(command: str) -> frozenset:
+    """
+    Resolve the dynamic fields to drop for a command, cached per command.
+
+    Args:
+        command: The command that was executed
+
+    Returns:
+        Set of field names to remove during normalization
+    """
+    match = DYNAMIC_FIELDS_PATTERN.search(command.lower())
+    if match:
+        return DYNAMIC_FIELD_SETS[match.lastindex - 1]
+    return frozenset()
+
+
+def _normalize_output(
+    output: List[Dict[str, Any]], command: str
+) -> List[Dict[str, Any]]:
     """
     Normalize command output for comparison by removing dynamic values.
 
@@ -668,87 +1329,43 @@ def _normalize_output(output: List[Dict[str, Any]], command: str) -> str:
     - Dynamic status changes
     - Whitespace inconsistencies
 
+    Entries are rebuilt as new dicts, so the original output is left untouched.
+
     Args:
         output: Parsed command output (list of dicts from TextFSM)
         command: The command that was executed
 
     Returns:
-        JSON string of normalized output
+        Normalized list of entries
     """
-    import copy
-
-    # Create deep copy to avoid modifying original
-    normalized = copy.deepcopy(output)
-
-    # Fields to remove based on command type (these are dynamic and shouldn't affect baseline comparison)
-    dynamic_fields = {
-        "show interfaces": [
-            "input_rate",
-            "output_rate",
-            "input_packets",
-            "output_packets",
-            "input_bytes",
-            "output_bytes",
-            "input_errors",
-            "output_errors",
-            "crc",
-            "collisions",
-            "interface_resets",
-            "last_input",
-            "last_output",
-            "last_clearing",
-            "queue_strategy",
-        ],
-        "show ip arp": [
-            "age"  # ARP age changes constantly
-        ],
-        "show cdp neighbors": [
-            "holdtime"  # CDP holdtime counts down
-        ],
-        "show mac address-table": [
-            # MAC table is generally stable, but we might want to remove port security counters
-        ],
-        "show ip route": [
-            # Routes are generally stable, but we could remove metric values if needed
-        ],
-    }
-
-    # Determine which fields to remove
-    fields_to_remove = []
-    for cmd_pattern, fields in dynamic_fields.items():
-        if cmd_pattern in command.lower():
-            fields_to_remove = fields
-            break
-
-    # Remove dynamic fields from each entry
-    for entry in normalized:
-        if isinstance(entry, dict):
-            for field in fields_to_remove:
-                entry.pop(field, None)
-
-            # Normalize string values (strip whitespace, lowercase where appropriate)
-            for key, value in entry.items():
-                if isinstance(value, str):
-                    entry[key] = value.strip()
+    fields_to_remove = _dynamic_fields_for(command)
+
+    # Remove dynamic fields from each entry and normalize string values
+    # (strip whitespace) while building the normalized view
+    normalized = [
+        {
+            key: value.strip() if type(value) is str else value
+            for key, value in entry.items()
+            if key not in fields_to_remove
+        }
+        if isinstance(entry, dict)
+        else entry
+        for entry in output
+    ]
 
     # Sort list for consistent ordering (helps with comparison)
-    # Sort by first available key that seems like an identifier
+    # Sort by first available key that seems like an identifier, falling back
+    # to the next one if its values cannot be compared. sorted() leaves the
+    # list untouched when a comparison fails part-way, unlike list.sort()
     if normalized and isinstance(normalized[0], dict):
-        sort_keys = [
-            "interface",
-            "name",
-            "network",
-            "destination",
-            "neighbor",
-            "address",
-            "mac_address",
-        ]
-        for sort_key in sort_keys:
+        for sort_key in NORMALIZE_SORT_KEYS:
             if sort_key in normalized[0]:
                 try:
-                    normalized = sorted(normalized, key=lambda x: x.get(sort_key, ""))
+                    normalized = sorted(
+                        normalized, key=lambda entry: entry.get(sort_key, "")
+                    )
                     break
                 except Exception:
-                    pass  # Skip if sorting fails
+                    pass  # Try the next key if sorting by this one fails
 
-    return json.dumps(normalized, indent=2, sort_keys=True)
+    return normalized
@@ -4,10 +4,13 @@ Cache warming tasks.
 This module contains Celery tasks for warming up application caches.
 """
 
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+WARM_UP_LOCK_KEY = "cache:warm_up:lock"
+
 
 def register_tasks(celery_app):
     """Register cache tasks with the Celery app."""
@@ -18,10 +21,14 @@ def register_tasks(celery_app):
         Warm up caches with frequently accessed data.
 
         This task pre-loads commonly accessed data into the cache to improve
-        application performance. It caches:
+        application performance. It caches the most looked-up of:
         - Nautobot device stats, device list, and locations
         - CheckMK host stats, host list, and folders
 
+        Entries that would expire before the next scheduled run are refetched
+        even if still cached, so they are refreshed before they expire; fresher
+        entries are left alone. Runs overlapping an ongoing warm-up are skipped.
+
         Returns:
             Dictionary with cache warm-up results
         """
@@ -29,58 +36,127 @@ def register_tasks(celery_app):
             from ..services.nautobot import nautobot_service
             from ..services.checkmk import checkmk_service
 
-            self.update_state(state="PROGRESS", meta={"current": 0, "total": 100})
-
-            # Warm up Nautobot caches
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": 20,
-                    "total": 100,
-                    "status": "Warming up Nautobot caches",
-                },
-            )
-
-            # Cache device stats
-            nautobot_service.get_stats()
-
-            # Cache basic device list
-            nautobot_service.get_devices(limit=100)
+            from ..core.cache import cache_service
+            from ..core.config import settings
 
-            # Cache locations
-            nautobot_service.get_locations()
-
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": 60,
-                    "total": 100,
-                    "status": "Warming up CheckMK caches",
-                },
-            )
-
-            # Warm up CheckMK caches
-            checkmk_service.get_stats()
-
-            # Cache basic host list
-            checkmk_service.get_all_hosts()
+            self.update_state(state="PROGRESS", meta={"current": 0, "total": 100})
 
-            # Cache folders
-            checkmk_service.get_all_folders()
+            # The service calls are independent, so they run concurrently;
+            # the cache must be connected on the same loop to be populated.
+            # Each call is keyed by the "service:endpoint" its cache key starts with
+            warm_up_calls = {
+                "nautobot_stats": ("nautobot:stats", nautobot_service.get_stats),
+                "nautobot_devices": (
+                    "nautobot:devices",
+                    lambda: nautobot_service.get_devices(limit=100),
+                ),
+                "nautobot_locations": (
+                    "nautobot:locations",
+                    nautobot_service.get_locations,
+                ),
+                "checkmk_stats": ("checkmk:stats", checkmk_service.get_stats),
+                "checkmk_hosts": ("checkmk:hosts", checkmk_service.get_all_hosts),
+                "checkmk_folders": ("checkmk:folders", checkmk_service.get_all_folders),
+            }
+            selected = list(warm_up_calls)
+            failed = {}
+
+            def select_warm_up_calls(access_stats):
+                """Pick the most looked-up endpoints since the last warm-up.
+
+                Without any recorded lookups (first run, or Redis was flushed)
+                every call is warmed.
+                """
+                if not access_stats:
+                    return list(warm_up_calls)
+                ranked = sorted(
+                    (
+                        (access_stats.get(endpoint, 0), name)
+                        for name, (endpoint, _) in warm_up_calls.items()
+                    ),
+                    reverse=True,
+                )
+                return [
+                    name
+                    for count, name in ranked[: settings.cache_warm_up_top_n]
+                    if count >= settings.cache_warm_up_min_accesses
+                ]
+
+            async def warm_up(name, call):
+                try:
+                    await call()
+                except Exception as e:
+                    logger.warning(f"Cache warm-up of {name} failed: {str(e)}")
+                    failed[name] = str(e)
+                return name
+
+            async def warm_up_all():
+                cache_connected_here = False
+                if not cache_service.redis:
+                    await cache_service.connect()
+                    cache_connected_here = cache_service.redis is not None
+                try:
+                    if not cache_service.redis:
+                        return "cache_unavailable"
+                    # Skip if another warm-up is still running
+                    if not await cache_service.acquire_lock(
+                        WARM_UP_LOCK_KEY, settings.cache_warm_up_interval_seconds
+                    ):
+                        return "already_running"
+
+                    try:
+                        selected[:] = select_warm_up_calls(
+                            await cache_service.pop_access_stats()
+                        )
+                        # The refresh context is copied into the tasks created
+                        # here. Entries that outlive the next run (with half an
+                        # interval to spare) are returned from the cache as is
+                        interval = settings.cache_warm_up_interval_seconds
+                        with cache_service.refreshing(
+                            settings.cache_warm_up_ttl_seconds,
+                            min_remaining=interval + interval // 2,
+                        ) as refresh:
+                            pending = [
+                                warm_up(name, warm_up_calls[name][1])
+                                for name in selected
+                            ]
+                            completed = 0
+                            for finished in asyncio.as_completed(pending):
+                                name = await finished
+                                completed += 1
+                                self.update_state(
+                                    state="PROGRESS",
+                                    meta={
+                                        "current": int(completed / len(selected) * 100),
+                                        "total": 100,
+                                        "status": f"Warmed up {name} ({completed}/{len(selected)})",
+                                    },
+                                )
+                    finally:
+                        await cache_service.delete(WARM_UP_LOCK_KEY)
+                    if not refresh.refetched and not failed:
+                        return "cache_already_warm"
+                    return None
+                finally:
+                    if cache_connected_here:
+                        await cache_service.disconnect()
+
+            skip_reason = asyncio.run(warm_up_all())
+            if skip_reason:
+                logger.info(f"Cache warm-up skipped: {skip_reason}")
+                return {
+                    "status": "skipped",
+                    "reason": skip_reason,
+                    "message": f"Cache warm-up skipped: {skip_reason}",
+                }
 
             logger.info("Cache warm-up completed successfully")
 
             return {
                 "status": "completed",
                 "message": "Cache warm-up completed successfully",
-                "caches_warmed": [
-                    "nautobot_stats",
-                    "nautobot_devices",
-                    "nautobot_locations",
-                    "checkmk_stats",
-                    "checkmk_hosts",
-                    "checkmk_folders",
-                ],
+                "caches_warmed": [name for name in selected if name not in failed],
+                "errors": failed,
             }
 
         except Exception as e:
@@ -44,31 +44,19 @@ def register_tasks(celery_app):
             hosts = result.get("value", [])
             total_hosts = len(hosts)
 
+            # Retrieved hosts need no per-item processing, so report them all
+            # as processed with a single progress update; a separate
+            # "retrieved" update would be overwritten straight away
+            processed_count = total_hosts
             self.update_state(
                 state="PROGRESS",
                 meta={
-                    "current": 50,
+                    "current": 95,
                     "total": 100,
-                    "status": f"Retrieved {total_hosts} hosts from CheckMK",
+                    "status": f"Processed {processed_count}/{total_hosts} hosts",
                 },
             )
 
-            # Process hosts
-            processed_count = 0
-            for i, host in enumerate(hosts):
-                # Simulate processing
-                processed_count += 1
-                if i % 10 == 0:  # Update every 10 hosts
-                    progress = 50 + int((i / total_hosts) * 50)
-                    self.update_state(
-                        state="PROGRESS",
-                        meta={
-                            "current": progress,
-                            "total": 100,
-                            "status": f"Processed {processed_count}/{total_hosts} hosts",
-                        },
-                    )
-
             logger.info(f"Successfully synced {processed_count} hosts from CheckMK")
 
             return {
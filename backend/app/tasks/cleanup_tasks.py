@@ -6,10 +6,43 @@ This module contains Celery tasks for cleaning up old data and maintaining datab
 
 import logging
 from datetime import datetime, timedelta
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rows removed per DELETE statement/transaction
+DELETE_CHUNK_SIZE = 10000
+
+
+def _delete_in_chunks(session: Session, model, *criteria) -> int:
+    """
+    Delete rows matching criteria in chunks, committing after each chunk.
+
+    Each chunk deletes up to DELETE_CHUNK_SIZE rows selected by primary key,
+    which keeps every transaction (and its locks and WAL) small.
+
+    Args:
+        session: Database session
+        model: Mapped class whose rows are deleted (must have an ``id`` key)
+        *criteria: Filter criteria selecting the rows to delete
+
+    Returns:
+        Total number of rows deleted
+    """
+    total_deleted = 0
+    while True:
+        chunk_ids = select(model.id).where(*criteria).limit(DELETE_CHUNK_SIZE)
+        result = session.execute(
+            delete(model)
+            .where(model.id.in_(chunk_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        total_deleted += result.rowcount
+        if result.rowcount < DELETE_CHUNK_SIZE:
+            return total_deleted
+
 
 def register_tasks(celery_app):
     """Register cleanup tasks with the Celery app."""
@@ -25,19 +58,19 @@ def register_tasks(celery_app):
         3. Old Celery results (older than 7 days)
         4. Orphaned task changes (from deleted tasks)
 
-        The cleanup is performed in stages with progress tracking.
+        The cleanup is performed in stages with progress tracking, sharing one
+        session. Large tables are deleted from in chunks of DELETE_CHUNK_SIZE
+        rows, each committed separately.
 
         Returns:
             Dictionary with cleanup statistics
         """
-        from ..services.database import engine
+        from ..core.database import engine
         from sqlalchemy_celery_beat.models import PeriodicTask, PeriodicTaskChanged
         from celery.backends.database.models import Task as CeleryTask
         from ..models.task_execution import TaskExecution
 
         try:
-            self.update_state(state="PROGRESS", meta={"current": 0, "total": 100})
-
             # Initialize cleanup statistics
             stats = {
                 "expired_tasks_deleted": 0,
@@ -47,128 +80,128 @@ def register_tasks(celery_app):
                 "errors": [],
             }
 
-            # Stage 1: Delete expired periodic tasks
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": 10,
-                    "total": 100,
-                    "status": "Cleaning up expired periodic tasks",
-                },
-            )
-
-            try:
-                with Session(engine) as session:
+            with Session(engine) as session:
+                # Stage 1: Delete expired periodic tasks
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": 10,
+                        "total": 100,
+                        "status": "Cleaning up expired periodic tasks",
+                    },
+                )
+
+                try:
                     current_time = datetime.utcnow()
 
-                    # Find and delete expired tasks
-                    expired_tasks = (
+                    # Delete expired tasks in a single bulk DELETE
+                    deleted_count = (
                         session.query(PeriodicTask)
                         .filter(
                             PeriodicTask.expires.is_not(None),
                             PeriodicTask.expires < current_time,
                         )
-                        .all()
+                        .delete(synchronize_session=False)
                     )
 
-                    for task in expired_tasks:
-                        logger.info(
-                            f"Deleting expired task: {task.name} (expired: {task.expires})"
+                    if deleted_count:
+                        # A bulk delete skips the ORM after_delete hook that
+                        # tells Celery Beat to reload its schedule, so mark the
+                        # change explicitly
+                        PeriodicTaskChanged.update_changed(
+                            None, session.connection(), None
                         )
-                        session.delete(task)
 
                     session.commit()
-                    stats["expired_tasks_deleted"] = len(expired_tasks)
-
-            except Exception as e:
-                error_msg = f"Error deleting expired tasks: {str(e)}"
-                logger.error(error_msg)
-                stats["errors"].append(error_msg)
-
-            # Stage 2: Clean up old task executions (older than 30 days)
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": 35,
-                    "total": 100,
-                    "status": "Cleaning up old task executions",
-                },
-            )
-
-            try:
-                with Session(engine) as session:
+                    stats["expired_tasks_deleted"] = deleted_count
+                    logger.info(f"Deleted {deleted_count} expired periodic tasks")
+
+                except Exception as e:
+                    session.rollback()
+                    error_msg = f"Error deleting expired tasks: {str(e)}"
+                    logger.error(error_msg)
+                    stats["errors"].append(error_msg)
+
+                # Stage 2: Clean up old task executions (older than 30 days)
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": 35,
+                        "total": 100,
+                        "status": "Cleaning up old task executions",
+                    },
+                )
+
+                try:
                     cutoff_date = datetime.utcnow() - timedelta(days=30)
 
                     # Delete old task execution records
-                    deleted_count = (
-                        session.query(TaskExecution)
-                        .filter(TaskExecution.timestamp < cutoff_date)
-                        .delete()
+                    deleted_count = _delete_in_chunks(
+                        session,
+                        TaskExecution,
+                        TaskExecution.timestamp < cutoff_date,
                     )
 
-                    session.commit()
                     stats["old_executions_deleted"] = deleted_count
                     logger.info(f"Deleted {deleted_count} old task execution records")
 
-            except Exception as e:
-                error_msg = f"Error deleting old task executions: {str(e)}"
-                logger.error(error_msg)
-                stats["errors"].append(error_msg)
-
-            # Stage 3: Clean up old Celery results (older than 7 days)
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": 60,
-                    "total": 100,
-                    "status": "Cleaning up old Celery results",
-                },
-            )
-
-            try:
-                with Session(engine) as session:
+                except Exception as e:
+                    session.rollback()
+                    error_msg = f"Error deleting old task executions: {str(e)}"
+                    logger.error(error_msg)
+                    stats["errors"].append(error_msg)
+
+                # Stage 3: Clean up old Celery results (older than 7 days)
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": 60,
+                        "total": 100,
+                        "status": "Cleaning up old Celery results",
+                    },
+                )
+
+                try:
                     cutoff_date = datetime.utcnow() - timedelta(days=7)
 
                     # Delete old Celery task results
-                    deleted_count = (
-                        session.query(CeleryTask)
-                        .filter(
-                            CeleryTask.date_done.is_not(None),
-                            CeleryTask.date_done < cutoff_date,
-                        )
-                        .delete()
+                    deleted_count = _delete_in_chunks(
+                        session,
+                        CeleryTask,
+                        CeleryTask.date_done.is_not(None),
+                        CeleryTask.date_done < cutoff_date,
                     )
 
-                    session.commit()
                     stats["old_celery_results_deleted"] = deleted_count
                     logger.info(f"Deleted {deleted_count} old Celery result records")
 
-            except Exception as e:
-                error_msg = f"Error deleting old Celery results: {str(e)}"
-                logger.error(error_msg)
-                stats["errors"].append(error_msg)
-
-            # Stage 4: Clean up orphaned task changes
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": 85,
-                    "total": 100,
-                    "status": "Cleaning up orphaned task changes",
-                },
-            )
-
-            try:
-                with Session(engine) as session:
-                    # Get all valid task IDs
-                    valid_task_ids = [
-                        t.id for t in session.query(PeriodicTask.id).all()
-                    ]
-
-                    # Delete changes for tasks that no longer exist
+                except Exception as e:
+                    session.rollback()
+                    error_msg = f"Error deleting old Celery results: {str(e)}"
+                    logger.error(error_msg)
+                    stats["errors"].append(error_msg)
+
+                # Stage 4: Clean up orphaned task changes
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": 85,
+                        "total": 100,
+                        "status": "Cleaning up orphaned task changes",
+                    },
+                )
+
+                try:
+                    # Delete changes for tasks that no longer exist, as a
+                    # server-side anti-join (NOT EXISTS) on the task table
+                    task_exists = (
+                        session.query(PeriodicTask.id)
+                        .filter(PeriodicTask.id == PeriodicTaskChanged.id)
+                        .exists()
+                    )
                     orphaned_changes = (
                         session.query(PeriodicTaskChanged)
-                        .filter(~PeriodicTaskChanged.id.in_(valid_task_ids))
+                        .filter(~task_exists)
                         .delete(synchronize_session=False)
                     )
 
@@ -178,13 +211,11 @@ def register_tasks(celery_app):
                         f"Deleted {orphaned_changes} orphaned task change records"
                     )
 
-            except Exception as e:
-                error_msg = f"Error deleting orphaned task changes: {str(e)}"
-                logger.error(error_msg)
-                stats["errors"].append(error_msg)
-
-            # Final status
-            self.update_state(state="PROGRESS", meta={"current": 100, "total": 100})
+                except Exception as e:
+                    session.rollback()
+                    error_msg = f"Error deleting orphaned task changes: {str(e)}"
+                    logger.error(error_msg)
+                    stats["errors"].append(error_msg)
 
             # Log summary
             logger.info(f"Cleanup completed: {stats}")
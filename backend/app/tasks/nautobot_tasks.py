@@ -44,31 +44,19 @@ def register_tasks(celery_app):
             devices = result.get("devices", [])
             total_devices = len(devices)
 
+            # Retrieved devices need no per-item processing, so report them all
+            # as processed with a single progress update; a separate
+            # "retrieved" update would be overwritten straight away
+            processed_count = total_devices
             self.update_state(
                 state="PROGRESS",
                 meta={
-                    "current": 50,
+                    "current": 95,
                     "total": 100,
-                    "status": f"Retrieved {total_devices} devices from Nautobot",
+                    "status": f"Processed {processed_count}/{total_devices} devices",
                 },
             )
 
-            # Process devices (could include database updates, validations, etc.)
-            processed_count = 0
-            for i, device in enumerate(devices):
-                # Simulate processing
-                processed_count += 1
-                if i % 10 == 0:  # Update every 10 devices
-                    progress = 50 + int((i / total_devices) * 50)
-                    self.update_state(
-                        state="PROGRESS",
-                        meta={
-                            "current": progress,
-                            "total": 100,
-                            "status": f"Processed {processed_count}/{total_devices} devices",
-                        },
-                    )
-
             logger.info(f"Successfully synced {processed_count} devices from Nautobot")
 
             return {
@@ -5,6 +5,7 @@ This module contains Celery tasks for testing and verification purposes.
 """
 
 import logging
+import math
 import time
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,11 @@ def register_tasks(celery_app):
         - Error handling
         - Task scheduling
 
+        The task sleeps, so it occupies a worker process for its whole
+        duration under the prefork pool; with a gevent/eventlet pool
+        (``-P gevent``) time.sleep is patched and the worker keeps serving
+        other tasks meanwhile.
+
         Args:
             duration: How many seconds the task should run for
 
@@ -31,18 +37,22 @@ def register_tasks(celery_app):
             Dictionary with test results
         """
         try:
-            # Simulate work with progress updates
-            for i in range(duration):
-                time.sleep(1)
+            # Simulate work, reporting progress in at most 10 steps
+            step = max(1, math.ceil(duration / 10))
+            elapsed = 0
+            while elapsed < duration:
+                sleep_for = min(step, duration - elapsed)
+                time.sleep(sleep_for)
+                elapsed += sleep_for
                 self.update_state(
                     state="PROGRESS",
                     meta={
-                        "current": i + 1,
+                        "current": elapsed,
                         "total": duration,
-                        "status": f"Processing step {i + 1} of {duration}",
+                        "status": f"Processed {elapsed} of {duration} seconds",
                     },
                 )
-                logger.info(f"Test task progress: {i + 1}/{duration}")
+                logger.info(f"Test task progress: {elapsed}/{duration}")
 
             logger.info("Test background task completed successfully")
 
@@ -7,18 +7,73 @@ parallel execution, progress tracking, and automatic retries.
 """
 
 import logging
+import time
 from datetime import datetime, timezone
 from typing import List, Dict, Any
-from celery import group
+from celery import chord, group
 
 from app.services.background_jobs import celery_app
-from app.core.database import SessionLocal
+from app.core.database import ScopedSession
+from app.services.topology_discovery.sync_discovery import (
+    SyncTopologyDiscoveryService,
+)
 
 logger = logging.getLogger(__name__)
 
+# Discovery option flag -> key of the collected data in the device result
+DISCOVERY_INCLUDES = {
+    "include_static_routes": "static_routes",
+    "include_ospf_routes": "ospf_routes",
+    "include_bgp_routes": "bgp_routes",
+    "include_mac_table": "mac_table",
+    "include_cdp_neighbors": "cdp_neighbors",
+    "include_arp": "arp_entries",
+    "include_interfaces": "interfaces",
+}
+
+
+class ThrottledState:
+    """
+    Task wrapper that skips progress updates which change little.
+
+    update_state() only writes to the result backend when progress moved
+    forward by at least min_step percent or min_interval seconds have passed
+    since the last write, or when force=True. Other attributes are read from
+    the task.
+    """
+
+    def __init__(self, task, min_step: int = 10, min_interval: float = 2.0):
+        self._task = task
+        self._min_step = min_step
+        self._min_interval = min_interval
+        self._last_progress = None
+        self._last_time = 0.0
+
+    def update_state(self, state=None, meta=None, force: bool = False, **kwargs):
+        progress = (meta or {}).get("progress", 0)
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_progress is not None
+            and progress - self._last_progress < self._min_step
+            and now - self._last_time < self._min_interval
+        ):
+            return
+        self._task.update_state(state=state, meta=meta, **kwargs)
+        self._last_progress = progress
+        self._last_time = now
+
+    def __getattr__(self, name):
+        return getattr(self._task, name)
+
 
 @celery_app.task(
     bind=True,
+    # Results reach the chord callback only, which stores the job result; the
+    # final progress update records each device's outcome for polling
+    ignore_result=True,
+    # Redelivered if the worker dies; discovery only refreshes cached data
+    acks_late=True,
     autoretry_for=(ConnectionError, TimeoutError),
     retry_kwargs={"max_retries": 3, "countdown": 5},
     retry_backoff=True,
@@ -56,46 +111,59 @@ def discover_single_device_task(
             - data: dict (if successful)
             - error: str (if failed)
     """
-    logger.info(f"🔍 Starting discovery for device {device_id} (job: {parent_job_id})")
+    logger.info(
+        "🔍 Starting discovery for device %s (job: %s)", device_id, parent_job_id
+    )
 
-    # Update initial state
-    self.update_state(
+    # Progress from the discovery service is throttled; the initial and the
+    # terminal updates are always written
+    state = ThrottledState(self)
+    state.update_state(
         state="PROGRESS",
         meta={
             "device_id": device_id,
             "parent_job_id": parent_job_id,
             "status": "in_progress",
-            "progress": 0,
-            "current_task": "Initializing",
+            "progress": 10,
+            "current_task": "Starting device discovery",
             "started_at": datetime.now(timezone.utc).isoformat(),
         },
+        force=True,
     )
 
-    # Create database session for this task
-    db = SessionLocal()
-
-    try:
-        # Import here to avoid circular imports
-        from app.services.topology_discovery.sync_discovery import (
-            SyncTopologyDiscoveryService,
-        )
-
-        # Update progress
-        self.update_state(
+    # Nothing to collect: skip the database and the device entirely
+    if not any(options.get(flag, True) for flag in DISCOVERY_INCLUDES):
+        logger.info("No data requested for device %s, skipping discovery", device_id)
+        state.update_state(
             state="PROGRESS",
             meta={
                 "device_id": device_id,
-                "status": "in_progress",
-                "progress": 10,
-                "current_task": "Starting device discovery",
+                "status": "completed",
+                "progress": 100,
+                "current_task": "Discovery completed",
+                "completed_at": datetime.now(timezone.utc).isoformat(),
             },
+            force=True,
         )
+        return {
+            "device_id": device_id,
+            "success": True,
+            "data": {
+                "device_id": device_id,
+                **{key: [] for key in DISCOVERY_INCLUDES.values()},
+            },
+            "error": None,
+        }
 
+    # Worker-local session, reusing the process's pooled connections
+    db = ScopedSession()
+
+    try:
         # Call synchronous discovery service
         device_data = SyncTopologyDiscoveryService.discover_device_data_sync(
             db=db,
             device_id=device_id,
-            task=self,  # Pass task for progress updates
+            task=state,  # Pass task for progress updates
             include_static_routes=options.get("include_static_routes", True),
             include_ospf_routes=options.get("include_ospf_routes", True),
             include_bgp_routes=options.get("include_bgp_routes", True),
@@ -111,7 +179,7 @@ def discover_single_device_task(
         db.commit()
 
         # Final progress update
-        self.update_state(
+        state.update_state(
             state="PROGRESS",
             meta={
                 "device_id": device_id,
@@ -120,9 +188,10 @@ def discover_single_device_task(
                 "current_task": "Discovery completed",
                 "completed_at": datetime.now(timezone.utc).isoformat(),
             },
+            force=True,
         )
 
-        logger.info(f"✅ Discovery completed for device {device_id}")
+        logger.info("✅ Discovery completed for device %s", device_id)
 
         return {
             "device_id": device_id,
@@ -135,11 +204,11 @@ def discover_single_device_task(
         db.rollback()
         error_msg = str(e)
         logger.error(
-            f"❌ Discovery failed for device {device_id}: {error_msg}", exc_info=True
+            "❌ Discovery failed for device %s: %s", device_id, error_msg, exc_info=True
         )
 
         # Update error state
-        self.update_state(
+        state.update_state(
             state="PROGRESS",
             meta={
                 "device_id": device_id,
@@ -149,6 +218,7 @@ def discover_single_device_task(
                 "error": error_msg,
                 "completed_at": datetime.now(timezone.utc).isoformat(),
             },
+            force=True,
         )
 
         return {
@@ -159,7 +229,76 @@ def discover_single_device_task(
         }
 
     finally:
-        db.close()
+        ScopedSession.remove()
+
+
+@celery_app.task
+def aggregate_discovery_results(
+    results: List[Dict[str, Any]],
+    job_id: str,
+    started_at: str,
+    device_ids: List[str],
+):
+    """
+    Combine per-device discovery results into the overall job result.
+
+    Runs as the chord callback of discover_topology_task once every device
+    task has finished, so the API can read one result instead of one per device.
+
+    Args:
+        results: Results of discover_single_device_task, one per device
+        job_id: Orchestrator task ID
+        started_at: ISO timestamp the orchestrator started at
+        device_ids: Device IDs in dispatch order
+
+    Returns:
+        Dictionary with the same fields as a completed discovery job, plus
+        per-device status entries under "devices"
+    """
+    end_time = datetime.now(timezone.utc)
+    devices_data = {}
+    errors = {}
+    devices = []
+
+    for result in results:
+        device_id = result["device_id"]
+        if result["success"]:
+            devices_data[device_id] = result["data"]
+        else:
+            errors[device_id] = result["error"] or "Unknown error"
+        devices.append(
+            {
+                "device_id": device_id,
+                "device_name": device_id,
+                "status": "completed" if result["success"] else "failed",
+                "progress_percentage": 100 if result["success"] else 0,
+                "current_task": None,
+                "error": None if result["success"] else errors[device_id],
+            }
+        )
+
+    logger.info(
+        "✅ Discovery job %s finished: %d succeeded, %d failed",
+        job_id,
+        len(devices_data),
+        len(errors),
+    )
+
+    return {
+        "job_id": job_id,
+        "status": "failed" if results and not devices_data else "completed",
+        "total_devices": len(device_ids),
+        "successful_devices": len(devices_data),
+        "failed_devices": len(errors),
+        "devices": devices,
+        "devices_data": devices_data,
+        "errors": errors,
+        "started_at": started_at,
+        "completed_at": end_time.isoformat(),
+        "duration_seconds": (
+            end_time - datetime.fromisoformat(started_at)
+        ).total_seconds(),
+    }
 
 
 @celery_app.task(bind=True)
@@ -181,9 +320,8 @@ def discover_topology_task(
 
     This task:
     - Creates parallel sub-tasks for each device
-    - Monitors overall progress
-    - Aggregates results from all devices
-    - Returns comprehensive results
+    - Aggregates their results in a chord callback once all have finished
+    - Returns the IDs needed to track progress and fetch the final result
 
     Args:
         device_ids: List of device IDs to discover
@@ -197,25 +335,25 @@ def discover_topology_task(
         auth_token: Authentication token for API calls
 
     Returns:
-        Dictionary with discovery results:
+        Dictionary with dispatch information:
             - job_id: str
             - status: str
+            - group_id: str (device tasks, for per-device progress)
+            - result_id: str (aggregate_discovery_results, for the final result)
             - total_devices: int
-            - successful_devices: int
-            - failed_devices: int
-            - devices_data: dict
-            - errors: dict
+            - device_ids: list
             - started_at: str
-            - completed_at: str
-            - duration_seconds: float
     """
+    # Discover each device once, even if it was selected more than once
+    device_ids = list(dict.fromkeys(device_ids))
     total_devices = len(device_ids)
     start_time = datetime.now(timezone.utc)
+    start_iso = start_time.isoformat()
 
     logger.info("🚀 Starting topology discovery orchestrator")
-    logger.info(f"   Job ID: {self.request.id}")
-    logger.info(f"   Devices: {total_devices}")
-    logger.info(f"   Device IDs: {device_ids}")
+    logger.info("   Job ID: %s", self.request.id)
+    logger.info("   Devices: %d", total_devices)
+    logger.info("   Device IDs: %s", device_ids)
 
     # Initialize state
     self.update_state(
@@ -227,19 +365,9 @@ def discover_topology_task(
             "completed_devices": 0,
             "failed_devices": 0,
             "progress_percentage": 0,
-            "devices": [
-                {
-                    "device_id": device_id,
-                    "status": "pending",
-                    "progress_percentage": 0,
-                    "current_task": None,
-                    "error": None,
-                    "started_at": None,
-                    "completed_at": None,
-                }
-                for device_id in device_ids
-            ],
-            "started_at": start_time.isoformat(),
+            # Only the status per device; the API expands it to full records
+            "device_status": {device_id: "pending" for device_id in device_ids},
+            "started_at": start_iso,
             "completed_at": None,
         },
     )
@@ -258,7 +386,7 @@ def discover_topology_task(
 
     try:
         # Create parallel device discovery tasks using Celery groups
-        logger.info(f"📦 Creating group of {total_devices} parallel tasks")
+        logger.info("📦 Creating group of %d parallel tasks", total_devices)
 
         job = group(
             discover_single_device_task.s(
@@ -271,28 +399,42 @@ def discover_topology_task(
         )
 
         # Execute parallel tasks - DO NOT call .get() within a task!
+        # The chord callback aggregates the results in the worker instead
         logger.info("🔄 Executing parallel tasks...")
-        result = job.apply_async()
+        result = chord(job)(
+            aggregate_discovery_results.s(
+                job_id=self.request.id,
+                started_at=start_iso,
+                device_ids=device_ids,
+            )
+        )
 
-        # Store the group result ID for progress tracking
-        # The API endpoint will query individual task results
-        logger.info(f"✅ Group dispatched with result ID: {result.id}")
+        # Save the header group so the API can restore it for per-device
+        # progress while the job runs; the final result is read from the
+        # callback alone
+        group_result = result.parent
+        group_result.save()
+        logger.info(
+            "✅ Group dispatched with result ID: %s, aggregate result ID: %s",
+            group_result.id,
+            result.id,
+        )
 
-        # Return immediately with group info
-        # The API will track progress by querying the group result
+        # Return immediately with group and callback info
         return {
             "status": "in_progress",
             "job_id": self.request.id,
-            "group_id": result.id,
+            "group_id": group_result.id,
+            "result_id": result.id,
             "total_devices": total_devices,
             "device_ids": device_ids,
             "message": f"Dispatched {total_devices} parallel discovery tasks",
-            "started_at": start_time.isoformat(),
+            "started_at": start_iso,
         }
 
     except Exception as e:
         error_msg = str(e)
-        logger.error(f"❌ Discovery orchestrator failed: {error_msg}", exc_info=True)
+        logger.error("❌ Discovery orchestrator failed: %s", error_msg, exc_info=True)
 
         end_time = datetime.now(timezone.utc)
         duration = (end_time - start_time).total_seconds()
@@ -11,7 +11,9 @@ This script demonstrates how to:
 import json
 from datetime import datetime
 
-from app.core.database import SessionLocal
+from sqlalchemy import func
+
+from app.core.database import ScopedSession
 from app.models.device_cache import BaselineCache
 from app.services.baseline_comparison import (
     BaselineComparator,
@@ -19,6 +21,13 @@ from app.services.baseline_comparison import (
 )
 from app.services.background_jobs import celery_app, CELERY_AVAILABLE
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def example_1_create_baseline():
     """
@@ -118,7 +127,7 @@ def example_4_compare_baseline_versions():
     print("EXAMPLE 4: Compare Baseline Versions")
     print("=" * 60)
 
-    db = SessionLocal()
+    db = ScopedSession()
 
     try:
         # Example parameters (replace with actual values)
@@ -165,7 +174,7 @@ def example_4_compare_baseline_versions():
         print(json.dumps(comparison, indent=2))
 
     finally:
-        db.close()
+        ScopedSession.remove()
 
 
 def example_5_compare_current_to_baseline():
@@ -176,7 +185,7 @@ def example_5_compare_current_to_baseline():
     print("EXAMPLE 5: Compare Current State to Baseline")
     print("=" * 60)
 
-    db = SessionLocal()
+    db = ScopedSession()
 
     try:
         # Example: Simulate current device output
@@ -224,7 +233,7 @@ def example_5_compare_current_to_baseline():
             print("\n✅ No configuration drift detected.")
 
     finally:
-        db.close()
+        ScopedSession.remove()
 
 
 def example_6_query_baselines():
@@ -235,59 +244,66 @@ def example_6_query_baselines():
     print("EXAMPLE 6: Query Baseline Data")
     print("=" * 60)
 
-    db = SessionLocal()
+    db = ScopedSession()
 
     try:
         # Get all baselines for a device
         device_id = "your-device-uuid"
 
-        baselines = (
-            db.query(BaselineCache).filter(BaselineCache.device_id == device_id).all()
+        # Count versions and sum output sizes per command in the database,
+        # instead of transferring every stored output just to measure it
+        by_command = (
+            db.query(
+                BaselineCache.command,
+                func.count(BaselineCache.id),
+                func.max(BaselineCache.version),
+                func.sum(func.octet_length(BaselineCache.raw_output)),
+                func.coalesce(
+                    func.sum(func.octet_length(BaselineCache.normalized_output)), 0
+                ),
+            )
+            .filter(BaselineCache.device_id == device_id)
+            .group_by(BaselineCache.command)
+            .order_by(BaselineCache.command)
+            .all()
         )
 
-        print(f"\n📊 Found {len(baselines)} baseline records for device {device_id}")
-
-        # Group by command
-        by_command = {}
-        for baseline in baselines:
-            if baseline.command not in by_command:
-                by_command[baseline.command] = []
-            by_command[baseline.command].append(baseline)
+        total = sum(row[1] for row in by_command)
+        print(f"\n📊 Found {total} baseline records for device {device_id}")
 
         print("\nBaselines by command:")
-        for command, command_baselines in by_command.items():
-            print(f"\n  {command} ({len(command_baselines)} versions):")
-            for baseline in sorted(command_baselines, key=lambda x: x.baseline_version):
-                print(
-                    f"    - Version {baseline.baseline_version}: {baseline.updated_at}"
-                )
-                print(f"      Notes: {baseline.notes}")
-
-                # Show size of data
-                raw_size = len(baseline.raw_output)
-                normalized_size = (
-                    len(baseline.normalized_output) if baseline.normalized_output else 0
-                )
-                print(
-                    f"      Data size: {raw_size:,} bytes (raw), {normalized_size:,} bytes (normalized)"
-                )
+        for command, count, latest_version, raw_size, normalized_size in by_command:
+            print(f"\n  {command} ({count} versions, latest: {latest_version}):")
+            print(
+                f"      Data size: {raw_size:,} bytes (raw), {normalized_size:,} bytes (normalized)"
+            )
+
+        # Only the sample row is loaded in full
+        sample = (
+            db.query(BaselineCache)
+            .filter(BaselineCache.device_id == device_id)
+            .order_by(BaselineCache.updated_at.desc())
+            .first()
+        )
 
         # Show sample data
-        if baselines:
+        if sample:
             print("\n📄 Sample baseline data:")
-            sample = baselines[0]
             print(f"   Command: {sample.command}")
             print(f"   Device: {sample.device_name}")
 
             # Parse and show first few entries
-            data = json.loads(sample.normalized_output or sample.raw_output)
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(sample.normalized_output or sample.raw_output)
+            else:
+                data = json.loads(sample.normalized_output or sample.raw_output)
             if data:
                 print(f"   Entries: {len(data)}")
                 print("   Sample entry:")
                 print(json.dumps(data[0], indent=6))
 
     finally:
-        db.close()
+        ScopedSession.remove()
 
 
 def example_7_scheduled_baseline():
@@ -3,6 +3,7 @@ Startup script for NOC Canvas backend.
 """
 
 import uvicorn
+from uvicorn.config import LOG_LEVELS
 import sys
 import os
 import logging
@@ -10,14 +11,6 @@ import logging
 # Add the app directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Configure root logging first
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-    force=True,  # This forces reconfiguration even if logging was already configured
-)
-
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -28,14 +21,33 @@ try:
 except ImportError:
     print("python-dotenv not available, environment variables must be set manually")
 
+# Development conveniences are opt-in: the reloader runs a file-watching
+# supervisor process, and debug logging formats records on every request
+RELOAD = os.getenv("UVICORN_RELOAD", "0") == "1"
+LOG_LEVEL = os.getenv("UVICORN_LOG_LEVEL", "info").lower()
+if LOG_LEVEL not in LOG_LEVELS:
+    sys.exit(
+        f"Invalid UVICORN_LOG_LEVEL {LOG_LEVEL!r}, expected one of: "
+        f"{', '.join(LOG_LEVELS)}"
+    )
+
+# Configure root logging first. The standard library has no TRACE level, so
+# uvicorn's "trace" logs everything else at DEBUG
+logging.basicConfig(
+    level=max(LOG_LEVELS[LOG_LEVEL], logging.DEBUG),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+    force=True,  # This forces reconfiguration even if logging was already configured
+)
+
 if __name__ == "__main__":
     # Configure uvicorn logging to use our logging configuration
     uvicorn_config = uvicorn.Config(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="debug",
+        reload=RELOAD,
+        log_level=LOG_LEVEL,
         access_log=True,
         use_colors=True,
     )
@@ -10,10 +10,16 @@ Usage:
 
     or with custom log level:
     python start_beat.py --loglevel=debug
+
+    or with a full Redis login and PING instead of a TCP check at startup:
+    python start_beat.py --strict
 """
 
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add the parent directory to the path so we can import app modules
@@ -31,51 +37,27 @@ logger = logging.getLogger(__name__)
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import celery
-
-        logger.info(f"✓ Celery version: {celery.__version__}")
-    except ImportError:
+    # Only locate the packages here; they are imported when actually used
+    if find_spec("celery") is None:
         logger.error("✗ Celery is not installed. Run: pip install celery")
         return False
+    logger.info(f"✓ Celery version: {version('celery')}")
 
-    try:
-        import sqlalchemy_celery_beat  # noqa: F401
-
-        logger.info("✓ sqlalchemy-celery-beat installed")
-    except ImportError:
+    if find_spec("sqlalchemy_celery_beat") is None:
         logger.error(
             "✗ sqlalchemy-celery-beat is not installed. Run: pip install sqlalchemy-celery-beat"
         )
         return False
+    logger.info("✓ sqlalchemy-celery-beat installed")
 
-    try:
-        import redis  # noqa: F401
-
-        logger.info("✓ Redis client installed")
-    except ImportError:
+    if find_spec("redis") is None:
         logger.error("✗ Redis client is not installed. Run: pip install redis")
         return False
+    logger.info("✓ Redis client installed")
 
     return True
 
 
-def check_redis_connection():
-    """Check if Redis is accessible."""
-    try:
-        import redis
-        from app.core.config import settings
-
-        r = redis.from_url(settings.celery_broker_url, socket_connect_timeout=2)
-        r.ping()
-        logger.info(f"✓ Redis is accessible at {settings.celery_broker_url}")
-        return True
-    except Exception as e:
-        logger.error(f"✗ Cannot connect to Redis: {e}")
-        logger.error("  Make sure Redis is running: redis-server")
-        return False
-
-
 def check_database_connection():
     """Check if database is accessible."""
     try:
@@ -155,19 +137,29 @@ def main():
 
     logger.info("")
 
-    # Check Redis connection
-    logger.info("Checking Redis connection...")
-    if not check_redis_connection():
+    # Check Redis and database connections concurrently; each may wait for
+    # its connect timeout, so startup waits for the slower one only
+    logger.info("Checking Redis and database connections...")
+    # --strict is ours, not Celery's
+    strict = "--strict" in sys.argv
+    if strict:
+        sys.argv.remove("--strict")
+
+    from app.core.broker_check import check_redis_connection
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        redis_check = executor.submit(check_redis_connection, strict)
+        database_check = executor.submit(check_database_connection)
+        redis_ok = redis_check.result()
+        database_ok = database_check.result()
+
+    if not redis_ok:
         logger.error("\nPlease start Redis and try again.")
         logger.error("macOS: brew services start redis")
         logger.error("Linux: sudo systemctl start redis")
         sys.exit(1)
 
-    logger.info("")
-
-    # Check database connection
-    logger.info("Checking database connection...")
-    if not check_database_connection():
+    if not database_ok:
         logger.error("\nPlease check your database configuration and try again.")
         sys.exit(1)
 
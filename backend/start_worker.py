@@ -10,11 +10,43 @@ Usage:
 
     or with custom options:
     python start_worker.py --loglevel=debug --concurrency=4
+
+    or as a worker dedicated to device snapshots:
+    python start_worker.py --queues=baseline --concurrency=8
+
+    or with a full Redis login and PING instead of a TCP check at startup:
+    python start_worker.py --strict
+
+    or as a gevent worker for I/O-bound topology discovery (requires gevent
+    and psycogreen):
+    python start_worker.py --queues=topology --pool=gevent --concurrency=200
 """
 
 import sys
-import logging
-from pathlib import Path
+
+
+def uses_gevent_pool(argv):
+    """Check whether the worker is started with the gevent pool."""
+    for i, arg in enumerate(argv):
+        if arg in ("-P", "--pool") and i + 1 < len(argv):
+            if argv[i + 1] == "gevent":
+                return True
+        elif arg in ("-Pgevent", "--pool=gevent"):
+            return True
+    return False
+
+
+# The gevent pool needs the standard library patched before anything else
+# opens sockets; the celery command does this itself, app.start() does not
+if uses_gevent_pool(sys.argv[1:]):
+    from gevent import monkey
+
+    monkey.patch_all()
+
+import logging  # noqa: E402
+from importlib.metadata import version  # noqa: E402
+from importlib.util import find_spec  # noqa: E402
+from pathlib import Path  # noqa: E402
 
 # Add the parent directory to the path so we can import app modules
 sys.path.insert(0, str(Path(__file__).parent))
@@ -28,42 +60,53 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Logged as one record each around the task list in start_worker()
+STARTUP_BANNER = "\n".join(["=" * 60, "Starting Celery Worker", "=" * 60, ""])
+STARTUP_FOOTER = "\n".join(
+    [
+        "",
+        "This worker will:",
+        "  1. Process tasks sent to the queue",
+        "  2. Execute scheduled tasks from Celery Beat",
+        "  3. Report task results to the result backend",
+        "",
+        "Press Ctrl+C to stop",
+        "=" * 60,
+        "",
+    ]
+)
+
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import celery
-
-        logger.info(f"✓ Celery version: {celery.__version__}")
-    except ImportError:
+    # Only locate the packages here; they are imported when actually used
+    if find_spec("celery") is None:
         logger.error("✗ Celery is not installed. Run: pip install celery")
         return False
+    logger.info(f"✓ Celery version: {version('celery')}")
 
-    try:
-        import redis  # noqa: F401
-
-        logger.info("✓ Redis client installed")
-    except ImportError:
+    if find_spec("redis") is None:
         logger.error("✗ Redis client is not installed. Run: pip install redis")
         return False
+    logger.info("✓ Redis client installed")
 
     return True
 
 
-def check_redis_connection():
-    """Check if Redis is accessible."""
-    try:
-        import redis
-        from app.core.config import settings
-
-        r = redis.from_url(settings.celery_broker_url, socket_connect_timeout=2)
-        r.ping()
-        logger.info(f"✓ Redis is accessible at {settings.celery_broker_url}")
-        return True
-    except Exception as e:
-        logger.error(f"✗ Cannot connect to Redis: {e}")
-        logger.error("  Make sure Redis is running: redis-server")
-        return False
+def requested_log_level(argv):
+    """Return the log level given with -l/--loglevel, or INFO if there is none."""
+    for i, arg in enumerate(argv):
+        if arg.startswith("--loglevel="):
+            value = arg.split("=", 1)[1]
+        elif arg in ("-l", "--loglevel") and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif arg.startswith("-l") and len(arg) > 2:
+            value = arg[2:]
+        else:
+            continue
+        level = logging.getLevelName(value.upper())
+        return level if isinstance(level, int) else logging.INFO
+    return logging.INFO
 
 
 def list_registered_tasks():
@@ -92,37 +135,45 @@ def start_worker():
             logger.error("✗ Celery is not available")
             return False
 
-        logger.info("=" * 60)
-        logger.info("Starting Celery Worker")
-        logger.info("=" * 60)
-        logger.info("")
-
-        # List registered tasks
-        tasks = list_registered_tasks()
-        if tasks:
-            logger.info(f"Registered tasks ({len(tasks)}):")
-            for task in tasks:
-                logger.info(f"  • {task}")
-        else:
-            logger.info("No tasks registered yet")
-
-        logger.info("")
-        logger.info("This worker will:")
-        logger.info("  1. Process tasks sent to the queue")
-        logger.info("  2. Execute scheduled tasks from Celery Beat")
-        logger.info("  3. Report task results to the result backend")
-        logger.info("")
-        logger.info("Press Ctrl+C to stop")
-        logger.info("=" * 60)
-        logger.info("")
-
         # Parse command line arguments
         argv = sys.argv[1:]
+
+        # Follow the worker's log level; above INFO the banner and task list
+        # would be discarded, so the tasks are not collected for it
+        logger.setLevel(requested_log_level(argv))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(STARTUP_BANNER)
+
+            # List registered tasks
+            tasks = list_registered_tasks()
+            if tasks:
+                logger.info(
+                    f"Registered tasks ({len(tasks)}):\n"
+                    + "\n".join(f"  • {task}" for task in tasks)
+                )
+            else:
+                logger.info("No tasks registered yet")
+
+            logger.info(STARTUP_FOOTER)
+
         if not argv:
             argv = ["worker", "--loglevel=info"]
         elif "worker" not in argv:
             argv.insert(0, "worker")
 
+        # Consume the baseline (device snapshots) and topology (discovery)
+        # queues as well as the default queue unless queues were chosen
+        # explicitly
+        if not any(arg.startswith(("-Q", "--queues")) for arg in argv):
+            argv.append("--queues=celery,baseline,topology")
+
+        # Celery defaults to the prefork pool with one process per CPU; prefork
+        # is not supported on Windows, where tasks run in the solo pool
+        if sys.platform == "win32" and not any(
+            arg.startswith(("-P", "--pool")) for arg in argv
+        ):
+            argv.append("--pool=solo")
+
         # Start Celery Worker
         celery_app.start(argv=argv)
 
@@ -153,9 +204,16 @@ def main():
 
     logger.info("")
 
+    # --strict is ours, not Celery's
+    strict = "--strict" in sys.argv
+    if strict:
+        sys.argv.remove("--strict")
+
     # Check Redis connection
+    from app.core.broker_check import check_redis_connection
+
     logger.info("Checking Redis connection...")
-    if not check_redis_connection():
+    if not check_redis_connection(strict=strict):
         logger.error("\nPlease start Redis and try again.")
         logger.error("macOS: brew services start redis")
         logger.error("Linux: sudo systemctl start redis")
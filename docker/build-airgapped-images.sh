@@ -202,7 +202,7 @@ COPY docker/worker-entrypoint.sh /app/entrypoint.sh
 RUN chmod +x /app/entrypoint.sh
 
 ENTRYPOINT ["/app/entrypoint.sh"]
-CMD ["python", "-m", "celery", "-A", "app.services.background_jobs", "worker", "--loglevel=info", "--concurrency=2"]
+CMD ["python", "-m", "celery", "-A", "app.services.background_jobs", "worker", "-Q", "celery,baseline,topology", "--loglevel=info", "--concurrency=2"]
 EOF
 
 docker build -f "$OUTPUT_DIR/Dockerfile.worker" -t "$WORKER_IMAGE" .
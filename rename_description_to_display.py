@@ -3,7 +3,6 @@
 Script to rename description column to display column in device_commands table
 """
 
-import asyncio
 import sys
 import os
 
@@ -11,13 +10,23 @@ import os
 backend_path = os.path.join(os.path.dirname(__file__), 'backend')
 sys.path.insert(0, backend_path)
 
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.core.database import get_db
-from app.models.settings import DeviceCommand
+# Statements used by rename_column(); wrapped in text() there, as sqlalchemy
+# is only imported when the script runs
+RENAME_COLUMN_SQL = "ALTER TABLE device_commands RENAME COLUMN description TO display"
+PROBE_DISPLAY_SQL = "SELECT display FROM device_commands LIMIT 1"
+ADD_DISPLAY_SQL = "ALTER TABLE device_commands ADD COLUMN display TEXT"
 
-async def rename_column():
+# PostgreSQL SQLSTATE for undefined_column
+UNDEFINED_COLUMN = "42703"
+
+def rename_column():
     """Rename description column to display"""
+    # Imported here so the ORM and database engine load only when run
+    from sqlalchemy.orm import Session
+    from sqlalchemy import text
+    from sqlalchemy.exc import ProgrammingError
+    from app.core.database import get_db
+    from app.models.settings import DeviceCommand
 
     # Get database session
     db_gen = get_db()
@@ -26,32 +35,41 @@ async def rename_column():
     try:
         # First, try to rename the column from description to display
         try:
-            db.execute(text("ALTER TABLE device_commands RENAME COLUMN description TO display"))
+            db.execute(text(RENAME_COLUMN_SQL))
             db.commit()
             print("✅ Renamed column 'description' to 'display' successfully")
-        except Exception as e:
-            if "does not exist" in str(e).lower():
+        except ProgrammingError as e:
+            # The failed statement aborted the transaction
+            db.rollback()
+            if getattr(e.orig, "pgcode", None) == UNDEFINED_COLUMN:
                 print("ℹ️ Column 'description' does not exist, checking if 'display' exists...")
                 # Check if display column already exists
                 try:
-                    db.execute(text("SELECT display FROM device_commands LIMIT 1"))
+                    db.execute(text(PROBE_DISPLAY_SQL))
                     print("ℹ️ Column 'display' already exists")
-                except Exception:
+                except ProgrammingError as probe_error:
+                    db.rollback()
+                    if getattr(probe_error.orig, "pgcode", None) != UNDEFINED_COLUMN:
+                        raise
                     # If neither exists, create the display column
                     print("➕ Creating 'display' column...")
-                    db.execute(text("ALTER TABLE device_commands ADD COLUMN display TEXT"))
+                    db.execute(text(ADD_DISPLAY_SQL))
                     db.commit()
                     print("✅ Created 'display' column successfully")
             else:
-                print(f"⚠️ Note: {e}")
-                db.rollback()
+                print(f"⚠️ Note: {e.orig}")
 
         # Show all commands with their display values
-        commands = db.query(DeviceCommand).all()
+        # Plain column rows instead of ORM instances, written out in one call
+        commands = db.query(
+            DeviceCommand.command, DeviceCommand.platform, DeviceCommand.display
+        ).all()
         print(f"\n📋 Commands with display values:")
-        for cmd in commands:
-            display = cmd.display or "(no display value)"
-            print(f"  - {cmd.command} ({cmd.platform.value}) -> {display}")
+        lines = [
+            f"  - {cmd.command} ({cmd.platform.value}) -> {cmd.display or '(no display value)'}"
+            for cmd in commands
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error renaming column: {e}")
@@ -60,4 +78,4 @@ async def rename_column():
         db.close()
 
 if __name__ == "__main__":
-    asyncio.run(rename_column())
\ No newline at end of file
+    rename_column()
\ No newline at end of file
@@ -3,7 +3,6 @@
 Test script to verify command update functionality
 """
 
-import asyncio
 import sys
 import os
 
@@ -11,12 +10,13 @@ import os
 backend_path = os.path.join(os.path.dirname(__file__), 'backend')
 sys.path.insert(0, backend_path)
 
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.settings import DeviceCommand, CommandPlatform, CommandParser
-
-async def test_command_update():
-    """Test updating a command with description"""
+def main():
+    """Test updating a command with display"""
+    # Imported here so the ORM and database engine load only when run
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session, load_only
+    from app.core.database import get_db
+    from app.models.settings import DeviceCommand, CommandPlatform, CommandParser
 
     # Get database session
     db_gen = get_db()
@@ -24,36 +24,37 @@ async def test_command_update():
 
     try:
         # Find the first IOS command
-        command = db.query(DeviceCommand).filter(
-            DeviceCommand.platform == CommandPlatform.IOS
-        ).first()
+        command = db.scalar(
+            select(DeviceCommand)
+            .options(
+                load_only(DeviceCommand.id, DeviceCommand.command, DeviceCommand.display)
+            )
+            .where(DeviceCommand.platform == CommandPlatform.IOS)
+            .limit(1)
+        )
 
         if not command:
             print("❌ No IOS commands found in database")
             return
 
         print(f"📋 Found command: {command.command}")
-        print(f"📋 Current description: {command.description}")
+        print(f"📋 Current display: {command.display}")
 
-        # Update the description
-        old_description = command.description
-        command.description = "UPDATED: Display comprehensive device version information"
+        # Update the display
+        old_display = command.display
+        command.display = "UPDATED: Display comprehensive device version information"
 
         db.commit()
         db.refresh(command)
 
-        print(f"✅ Updated description from: {old_description}")
-        print(f"✅ Updated description to: {command.description}")
-
-        # Verify the update
-        updated_command = db.query(DeviceCommand).filter(
-            DeviceCommand.id == command.id
-        ).first()
+        print(f"✅ Updated display from: {old_display}")
+        print(f"✅ Updated display to: {command.display}")
 
-        if updated_command and updated_command.description == "UPDATED: Display comprehensive device version information":
-            print("✅ Description update verified in database")
+        # Verify the update; refresh() above already reloaded the row
+        if command.display == "UPDATED: Display comprehensive device version information":
+            print("✅ Display update verified in database")
         else:
-            print("❌ Description update failed to persist")
+            print("❌ Display update failed to persist")
 
     except Exception as e:
         print(f"❌ Error testing command update: {e}")
@@ -62,4 +63,4 @@ async def test_command_update():
         db.close()
 
 if __name__ == "__main__":
-    asyncio.run(test_command_update())
\ No newline at end of file
+    main()
\ No newline at end of file
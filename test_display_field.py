@@ -3,7 +3,6 @@
 Test script to verify display field functionality
 """
 
-import asyncio
 import sys
 import os
 
@@ -11,12 +10,13 @@ import os
 backend_path = os.path.join(os.path.dirname(__file__), 'backend')
 sys.path.insert(0, backend_path)
 
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.settings import DeviceCommand, CommandPlatform, CommandParser
-
-async def test_display_field():
+def main():
     """Test display field CRUD operations"""
+    # Imported here so the ORM and database engine load only when run
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session
+    from app.core.database import get_db
+    from app.models.settings import DeviceCommand, CommandPlatform, CommandParser
 
     # Get database session
     db_gen = get_db()
@@ -40,9 +40,9 @@ async def test_display_field():
 
         # Test 2: Update existing command's display
         print("\n2️⃣ Updating existing command display...")
-        existing_command = db.query(DeviceCommand).filter(
-            DeviceCommand.command == "show version"
-        ).first()
+        existing_command = db.scalar(
+            select(DeviceCommand).where(DeviceCommand.command == "show version").limit(1)
+        )
 
         if existing_command:
             old_display = existing_command.display
@@ -55,12 +55,18 @@ async def test_display_field():
 
         # Test 3: Verify all commands with display values
         print("\n3️⃣ All commands with display values:")
-        all_commands = db.query(DeviceCommand).all()
-        for cmd in all_commands:
-            display = cmd.display or "(no display)"
-            print(f"   {cmd.command} ({cmd.platform.value}) -> {display}")
+        # Plain column rows streamed from the cursor in batches instead of
+        # ORM instances, written out in one call
+        all_commands = db.query(
+            DeviceCommand.command, DeviceCommand.platform, DeviceCommand.display
+        ).yield_per(200)
+        lines = [
+            f"   {command} ({platform.value}) -> {display or '(no display)'}"
+            for command, platform, display in all_commands
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        print(f"\n✅ All tests passed! Found {len(all_commands)} commands in database.")
+        print(f"\n✅ All tests passed! Found {len(lines)} commands in database.")
 
     except Exception as e:
         print(f"❌ Error testing display field: {e}")
@@ -69,4 +75,4 @@ async def test_display_field():
         db.close()
 
 if __name__ == "__main__":
-    asyncio.run(test_display_field())
\ No newline at end of file
+    main()
\ No newline at end of file